@@ -1,7 +1,6 @@
 """Example: Hello World Agent"""
 
 import asyncio
-from uuid import uuid4
 
 from aiconexus.core.agent import Agent
 
@@ -9,6 +8,8 @@ from aiconexus.core.agent import Agent
 class HelloWorldAgent(Agent):
     """A simple agent that greets users"""
 
+    __slots__ = ()
+
     async def initialize(self) -> None:
         """Initialize the agent"""
         print(f"Initializing {self.name} ({self.agent_id})")
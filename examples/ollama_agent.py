@@ -15,28 +15,134 @@ Usage:
 """
 
 import asyncio
+import concurrent.futures
 import logging
-from typing import Optional, Any, Dict
-from uuid import uuid4
-import requests
+import signal
+import sys
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, Any, AsyncIterator, Dict, FrozenSet, Tuple
 
-from aiconexus.core.agent import Agent, Capability
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # Windows or speedups extra not installed
+    uvloop = None
+
+from aiconexus.core.agent import Agent
+
+if TYPE_CHECKING:
+    import aiohttp
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Response cache settings
+EXACT_CACHE_SIZE = 512
+SEMANTIC_CACHE_SIZE = 256
+SEMANTIC_THRESHOLD = 0.92
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+# Model names reported by /api/tags, per Ollama URL: url -> (fetched_at, names)
+TAGS_CACHE_TTL_S = 60.0
+_TAGS_CACHE: Dict[str, Tuple[float, FrozenSet[str]]] = {}
+
+# Capability definitions, built once at import and shared by every agent
+_REASONING_INPUT_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "prompt": {
+            "type": "string",
+            "description": "The prompt for reasoning"
+        }
+    },
+    "required": ["prompt"]
+})
+_REASONING_OUTPUT_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "response": {"type": "string"},
+        "model": {"type": "string"}
+    }
+})
+_REASONING_SLA = MappingProxyType({
+    "latency_ms": 5000,
+    "availability_percent": 99.0,
+    "timeout_ms": 30000
+})
+_REASONING_PRICING = MappingProxyType({
+    "model_type": "per_call",
+    "base_cost": "0.001",
+    "unit": "call",
+    "currency": "AIC"
+})
+
+
+def _load_scan_scores():
+    """
+    Build the semantic-cache scan kernel (called once, on first use).
+
+    numba and NumPy are imported here rather than at module import, so
+    agents that never fill the semantic cache don't pay for them.
+    """
+    try:
+        import numba
+    except ImportError:  # semantic cache falls back to a NumPy scan
+        return lambda query, buffer: buffer @ query
+    import numpy as np
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _scan_scores(query, buffer):  # pragma: no cover - compiled
+        n, dim = buffer.shape
+        scores = np.empty(n, dtype=np.float32)
+        for i in numba.prange(n):
+            acc = np.float32(0.0)
+            for j in range(dim):
+                acc += buffer[i, j] * query[j]
+            scores[i] = acc
+        return scores
+
+    return _scan_scores
+
+
+_scan_scores = None
+
+
+def _scan(query, buffer) -> Tuple[int, float]:
+    """Return (row, score) of the buffer row with the highest dot product"""
+    global _scan_scores
+    if _scan_scores is None:
+        _scan_scores = _load_scan_scores()
+    scores = _scan_scores(query, buffer)
+    best = int(scores.argmax())
+    return best, float(scores[best])
+
+
+# Prompt micro-batching: prompts arriving within the window are sent together
+BATCH_MAX_SIZE = 8
+BATCH_WINDOW_S = 0.005
+
 
 class OllamaAgent(Agent):
     """An AI agent powered by Ollama local LLM"""
 
+    __slots__ = (
+        "ollama_model", "ollama_base_url",
+        "_session", "_generate_timeout",
+        "_pending", "_batch_task", "_batches",
+        "_exact_cache", "enable_semantic_cache", "_embedder", "_embedder_lock",
+        "_sem_vectors", "_sem_responses", "_sem_next",
+    )
+
     def __init__(
         self,
         name: str = "ollama-agent",
         ollama_model: str = "phi",
         ollama_base_url: str = "http://localhost:11434",
+        enable_semantic_cache: bool = True,
         **kwargs
     ):
         """Initialize the Ollama agent"""
@@ -45,34 +151,68 @@ class OllamaAgent(Agent):
         self.ollama_model = ollama_model
         self.ollama_base_url = ollama_base_url
         
-        logger.info(f"Created OllamaAgent: {name}")
-        logger.info(f"  Agent ID: {self.agent_id}")
-        logger.info(f"  Model: {ollama_model}")
-        logger.info(f"  Ollama URL: {ollama_base_url}")
+        # Shared HTTP session (keep-alive pool), created in initialize()
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._generate_timeout: Optional["aiohttp.ClientTimeout"] = None
+        
+        # Pending (prompt, future) pairs drained by the batch loop
+        self._pending: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        self._batches: set = set()  # batches still generating
+        
+        # Response cache: exact (capability_id, prompt) LRU, then semantic
+        # lookup over prompt embeddings (optional, needs sentence-transformers)
+        self._exact_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self.enable_semantic_cache = enable_semantic_cache
+        self._embedder = None
+        self._embedder_lock = asyncio.Lock()
+        self._sem_vectors = None  # np.ndarray (SEMANTIC_CACHE_SIZE, dim), float32
+        self._sem_responses: list = []
+        self._sem_next = 0
+        
+        logger.info("Created OllamaAgent: %s", name)
+        logger.info("  Agent ID: %s", self.agent_id)
+        logger.info("  Model: %s", ollama_model)
+        logger.info("  Ollama URL: %s", ollama_base_url)
 
     async def initialize(self) -> None:
         """Initialize the agent"""
-        logger.info(f"Initializing agent {self.name}...")
+        logger.info("Initializing agent %s...", self.name)
         
-        # Check Ollama is available
-        try:
-            response = requests.get(
-                f"{self.ollama_base_url}/api/tags",
-                timeout=2
+        import aiohttp
+        
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
             )
-            models = response.json().get("models", [])
-            logger.info(f"Ollama is available with {len(models)} models")
+        self._generate_timeout = aiohttp.ClientTimeout(total=30)
+        
+        # Check Ollama is available (skipped while the cached tag list is fresh)
+        try:
+            now = time.monotonic()
+            cached = _TAGS_CACHE.get(self.ollama_base_url)
+            if cached and now - cached[0] < TAGS_CACHE_TTL_S:
+                model_names = cached[1]
+            else:
+                async with self._session.get(
+                    f"{self.ollama_base_url}/api/tags",
+                    timeout=aiohttp.ClientTimeout(total=2)
+                ) as response:
+                    models = orjson.loads(await response.read()).get("models", [])
+                model_names = frozenset(m.get("name", "").partition(":")[0] for m in models)
+                _TAGS_CACHE[self.ollama_base_url] = (now, model_names)
+            logger.info("Ollama is available with %d models", len(model_names))
             
             # Check if our model is available
-            model_names = [m.get("name", "").split(":")[0] for m in models]
-            if self.ollama_model.split(":")[0] not in model_names:
+            if self.ollama_model.partition(":")[0] not in model_names:
                 logger.warning(
-                    f"Model {self.ollama_model} not found. "
-                    f"Available: {model_names}"
+                    "Model %s not found. Available: %s",
+                    self.ollama_model, sorted(model_names)
                 )
         except Exception as e:
-            logger.error(f"Cannot connect to Ollama: {e}")
+            logger.error("Cannot connect to Ollama: %s", e)
             logger.error("Start Ollama with: ollama serve")
+            await self._session.close()
             raise
         
         # Register capabilities
@@ -80,41 +220,243 @@ class OllamaAgent(Agent):
             capability_id="reasoning",
             name="Reasoning",
             description="Perform reasoning and analysis using Ollama",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "prompt": {
-                        "type": "string",
-                        "description": "The prompt for reasoning"
-                    }
-                },
-                "required": ["prompt"]
-            },
-            output_schema={
-                "type": "object",
-                "properties": {
-                    "response": {"type": "string"},
-                    "model": {"type": "string"}
-                }
-            },
-            sla={
-                "latency_ms": 5000,
-                "availability_percent": 99.0,
-                "timeout_ms": 30000
-            },
-            pricing={
-                "model_type": "per_call",
-                "base_cost": "0.001",
-                "unit": "call",
-                "currency": "AIC"
-            }
+            input_schema=_REASONING_INPUT_SCHEMA,
+            output_schema=_REASONING_OUTPUT_SCHEMA,
+            sla=_REASONING_SLA,
+            pricing=_REASONING_PRICING
         )
         
+        if self._batch_task is None or self._batch_task.done():
+            self._pending = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._batch_loop())
+        
         logger.info("Agent initialized with capabilities")
 
     async def shutdown(self) -> None:
         """Shutdown the agent"""
-        logger.info(f"Shutting down agent {self.name}")
+        logger.info("Shutting down agent %s", self.name)
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+            try:
+                await self._batch_task
+            except asyncio.CancelledError:
+                pass
+            self._batch_task = None
+        for task in list(self._batches):
+            task.cancel()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+        if self._pending is not None:
+            self._cancel_waiters([])
+            self._pending = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _call_ollama(self, prompt: str) -> str:
+        """Queue a prompt for the next batch and wait for its completion"""
+        if self._batch_task is None:
+            return await self._generate(prompt)
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._pending.put((prompt, future))
+        return await future
+
+    async def _batch_loop(self) -> None:
+        """
+        Drain queued prompts in micro-batches and fire them concurrently.
+
+        Each batch runs as its own task, so prompts arriving while a batch
+        is still generating go into the next batch instead of waiting
+        behind its slowest generation.
+        """
+        loop = asyncio.get_running_loop()
+        batch = []
+        try:
+            while True:
+                batch = [await self._pending.get()]
+                deadline = loop.time() + BATCH_WINDOW_S
+                while len(batch) < BATCH_MAX_SIZE:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._pending.get(), timeout=remaining)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                
+                task = asyncio.create_task(self._run_batch(batch))
+                self._batches.add(task)
+                task.add_done_callback(self._batches.discard)
+                batch = []
+        finally:
+            # Cancelled while collecting (shutdown): nothing else resolves these
+            self._cancel_waiters(batch)
+
+    async def _run_batch(self, batch: list) -> None:
+        """Generate every prompt of a batch concurrently and resolve its futures"""
+        try:
+            results = await asyncio.gather(
+                *(self._generate(prompt) for prompt, _ in batch),
+                return_exceptions=True
+            )
+            for (_, future), result in zip(batch, results, strict=True):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            # Cancelled mid-generation (shutdown): release the waiters
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    def _cancel_waiters(self, batch: list) -> None:
+        """Cancel the futures of batch and of every queued prompt"""
+        while not self._pending.empty():
+            batch.append(self._pending.get_nowait())
+        for _, future in batch:
+            if not future.done():
+                future.cancel()
+
+    async def _generate(self, prompt: str) -> str:
+        """Send a prompt to Ollama and return the generated text"""
+        parts = [part async for part in self.stream_generate(prompt)]
+        return "".join(parts) if parts else "No response"
+
+    async def stream_generate(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream generated text from Ollama as it is produced.
+
+        Ollama streams one JSON object per line; each line is decoded as it
+        arrives instead of buffering the whole body and parsing it afterwards.
+        """
+        async with self._session.post(
+            f"{self.ollama_base_url}/api/generate",
+            data=orjson.dumps({
+                "model": self.ollama_model,
+                "prompt": prompt,
+                "stream": True
+            }),
+            headers=_JSON_HEADERS,
+            timeout=self._generate_timeout
+        ) as response:
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                chunk = orjson.loads(line)
+                if "error" in chunk:
+                    raise RuntimeError(chunk["error"])
+                if chunk.get("response"):
+                    yield chunk["response"]
+                if chunk.get("done"):
+                    break
+
+    async def _embed(self, prompt: str):
+        """
+        Embed a prompt, or return None if semantic caching is unavailable.
+
+        Loading the model (possibly a download) and encoding are blocking,
+        so both run in a worker thread rather than on the event loop.
+        """
+        if not self.enable_semantic_cache:
+            return None
+        if self._embedder is None:
+            async with self._embedder_lock:
+                if self._embedder is None:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+                    except ImportError:
+                        logger.info("sentence-transformers not installed, semantic cache disabled")
+                        self.enable_semantic_cache = False
+                        return None
+                    self._embedder = await asyncio.to_thread(
+                        SentenceTransformer, EMBEDDING_MODEL
+                    )
+        embedding = await asyncio.to_thread(
+            self._embedder.encode,
+            prompt, normalize_embeddings=True, convert_to_numpy=True
+        )
+        return embedding.astype("float32")
+
+    async def _cache_lookup(self, capability_id: str, prompt: str) -> Tuple[Optional[str], Any]:
+        """
+        Look up a cached response.
+
+        Returns:
+            (cached response or None, prompt embedding or None)
+        """
+        key = (capability_id, prompt)
+        cached = self._exact_cache.get(key)
+        if cached is not None:
+            self._exact_cache.move_to_end(key)
+            return cached, None
+        
+        embedding = await self._embed(prompt)
+        if embedding is None or not self._sem_responses:
+            return None, embedding
+        
+        # Embeddings are normalized, so the dot product is the cosine score.
+        # Rows are contiguous float32 so the scan reads unit-stride memory.
+        best, score = _scan(embedding, self._sem_vectors[:len(self._sem_responses)])
+        if score > SEMANTIC_THRESHOLD:
+            return self._sem_responses[best], embedding
+        return None, embedding
+
+    def _cache_store(self, capability_id: str, prompt: str, response: str, embedding: Any) -> None:
+        """Store a response in the exact and semantic caches"""
+        self._exact_cache[(capability_id, prompt)] = response
+        if len(self._exact_cache) > EXACT_CACHE_SIZE:
+            self._exact_cache.popitem(last=False)
+        
+        if embedding is None:
+            return
+        if self._sem_vectors is None:
+            import numpy as np
+            self._sem_vectors = np.zeros(
+                (SEMANTIC_CACHE_SIZE, embedding.shape[0]), dtype=np.float32
+            )
+        
+        # Ring buffer: overwrite the oldest slot once full
+        slot = self._sem_next
+        self._sem_vectors[slot] = embedding
+        if slot < len(self._sem_responses):
+            self._sem_responses[slot] = response
+        else:
+            self._sem_responses.append(response)
+        self._sem_next = (slot + 1) % SEMANTIC_CACHE_SIZE
+
+    async def _handle_reasoning(self, prompt: str) -> Dict[str, Any]:
+        """Run the reasoning capability for a prompt"""
+        try:
+            cached, embedding = await self._cache_lookup("reasoning", prompt)
+            if cached is not None:
+                logger.info("Reasoning cache hit")
+                return {
+                    "response": cached,
+                    "model": self.ollama_model,
+                    "success": True,
+                    "cached": True
+                }
+            
+            logger.info("Reasoning about: %.100s...", prompt)
+            
+            answer = await self._call_ollama(prompt)
+            self._cache_store("reasoning", prompt, answer, embedding)
+            
+            return {
+                "response": answer,
+                "model": self.ollama_model,
+                "success": True
+            }
+        
+        except Exception as e:
+            logger.error("Error executing reasoning: %s", e)
+            return {"error": str(e), "success": False}
 
     async def execute_capability(
         self,
@@ -128,42 +470,44 @@ class OllamaAgent(Agent):
             if not prompt:
                 return {"error": "Prompt is required"}
             
-            try:
-                logger.info(f"Reasoning about: {prompt[:100]}...")
-                
-                response = requests.post(
-                    f"{self.ollama_base_url}/api/generate",
-                    json={
-                        "model": self.ollama_model,
-                        "prompt": prompt,
-                        "stream": False
-                    },
-                    timeout=30
-                )
-                
-                result = response.json()
-                answer = result.get("response", "No response")
-                
-                return {
-                    "response": answer,
-                    "model": self.ollama_model,
-                    "success": True
-                }
-            
-            except Exception as e:
-                logger.error(f"Error executing reasoning: {e}")
-                return {"error": str(e), "success": False}
+            return await self._handle_reasoning(prompt)
         
         else:
             return {"error": f"Unknown capability: {capability_id}"}
 
 
+# Console banners, built once at import
+_RULE = "=" * 70
+_DASH = "-" * 70
+_HEADER = f"\n{_RULE}\n{'AIConexus - Ollama Agent with SDK'.center(70)}\n{_RULE}\n\n"
+_READY = f"\n{_DASH}\nAgent ready with capabilities:\n{_DASH}\n"
+_TESTING = f"\n{_DASH}\nTesting capability execution...\n{_DASH}\n\n"
+_RUNNING = (
+    f"{_DASH}\n"
+    "Agent running for 30 seconds (allow gateway to discover)...\n"
+    f"{_DASH}\n"
+    "To connect with gateway:\n"
+    "  Terminal 1: ./run_gateway.sh\n"
+    "  Terminal 2: PYTHONPATH=src python examples/ollama_agent.py\n"
+    f"{_DASH}\n\n"
+)
+_FOOTER = f"\n{_RULE}\n{'Agent stopped'.center(70)}\n{_RULE}\n\n"
+
+
 async def main():
     """Run the agent"""
     
-    print("\n" + "="*70)
-    print("AIConexus - Ollama Agent with SDK".center(70))
-    print("="*70 + "\n")
+    sys.stdout.write(_HEADER)
+    
+    # Ollama serves one model at a time, so a couple of worker threads are
+    # enough for the blocking work aiohttp hands off (DNS resolution); this
+    # keeps the default executor from spinning up dozens of idle threads.
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="ollama-io"
+        )
+    )
     
     # Create agent
     agent = OllamaAgent(
@@ -175,17 +519,13 @@ async def main():
         # Initialize
         await agent.initialize()
         
-        print("\n" + "-"*70)
-        print("Agent ready with capabilities:")
-        print("-"*70)
+        sys.stdout.write(_READY)
         for cap_id, cap in agent.capabilities.items():
             print(f"  - {cap.name} ({cap_id})")
             print(f"    {cap.description}")
         
         # Test capability
-        print("\n" + "-"*70)
-        print("Testing capability execution...")
-        print("-"*70 + "\n")
+        sys.stdout.write(_TESTING)
         
         result = await agent.execute_capability(
             "reasoning",
@@ -198,28 +538,36 @@ async def main():
             print(f"Error: {result.get('error')}\n")
         
         # Keep running for 30 seconds to allow gateway discovery
-        print("-"*70)
-        print("Agent running for 30 seconds (allow gateway to discover)...")
-        print("-"*70)
-        print("To connect with gateway:")
-        print("  Terminal 1: ./run_gateway.sh")
-        print("  Terminal 2: PYTHONPATH=src python examples/ollama_agent.py")
-        print("-"*70 + "\n")
-        
-        await asyncio.sleep(30)
+        sys.stdout.write(_RUNNING)
+        
+        # Stop early on SIGINT/SIGTERM instead of sleeping out the window
+        shutdown_event = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, shutdown_event.set)
+            except NotImplementedError:  # Windows event loops
+                pass
+        try:
+            await asyncio.wait_for(shutdown_event.wait(), timeout=30)
+        except asyncio.TimeoutError:
+            pass
     
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         raise
     
     finally:
         await agent.shutdown()
-        print("\n" + "="*70)
-        print("Agent stopped".center(70))
-        print("="*70 + "\n")
+        sys.stdout.write(_FOOTER)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
@@ -11,6 +11,11 @@ import asyncio
 import logging
 from typing import List
 
+try:
+    import numba
+except ImportError:  # numeric tools fall back to the builtin sum()
+    numba = None
+
 from aiconexus.sdk import (
     SDKAgent,
     ExpertiseArea,
@@ -22,6 +27,31 @@ from aiconexus.sdk import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Inputs shorter than this are summed in Python; the JIT call overhead isn't worth it
+FAST_SUM_MIN_SIZE = 64
+
+
+def _sum(numbers) -> float:
+    """Sum a list of numbers"""
+    return sum(numbers)
+
+
+if numba is not None:
+    import numpy as np
+
+    @numba.njit(cache=True)
+    def _fast_sum(values):  # pragma: no cover - compiled
+        total = 0.0
+        for v in values:
+            total += v
+        return total
+
+    def _sum(numbers) -> float:
+        """Sum a list of numbers, via the compiled kernel for large inputs"""
+        if len(numbers) < FAST_SUM_MIN_SIZE:
+            return sum(numbers)
+        return float(_fast_sum(np.asarray(numbers, dtype=np.float64)))
+
 
 # ========== EXAMPLE 1: SIMPLE AGENT WITH DEFAULTS ==========
 
@@ -68,11 +98,11 @@ async def example_custom_tools():
     # Define custom tools
     def calculate_sum(numbers: list) -> float:
         """Calculate sum of numbers"""
-        return sum(numbers)
+        return _sum(numbers)
     
     def calculate_average(numbers: list) -> float:
         """Calculate average of numbers"""
-        return sum(numbers) / len(numbers) if numbers else 0
+        return _sum(numbers) / len(numbers) if numbers else 0
     
     custom_tools = [
         Tool(
@@ -366,7 +396,7 @@ async def example_sdk_features():
     # Feature 4: Auto-delegation
     print("\n4️⃣  Auto-Delegation Enabled:")
     print(f"   Can contact other agents: {agent.auto_delegation}")
-    print(f"   Delegation rules: {agent.delegation_rules}")
+    print(f"   Delegation rules: {dict(agent.delegation_rules)}")
     
     # Feature 5: Execution
     print("\n5️⃣  Execute Task:")
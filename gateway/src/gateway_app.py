@@ -13,4 +13,25 @@ app = create_app(agent_timeout=60, cleanup_interval=10)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:  # Windows, or uvicorn installed without [standard]
+        loop_impl = "asyncio"
+    
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "h11"
+    
+    uvicorn.run(
+        app,
+        host="127.0.0.1",
+        port=8000,
+        loop=loop_impl,
+        http=http_impl,
+        ws="websockets",
+        workers=1,
+    )
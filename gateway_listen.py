@@ -20,6 +20,19 @@ from datetime import datetime
 
 from src.gateway.server import create_app
 
+try:
+    import uvloop
+except ImportError:  # Windows, or uvicorn installed without [standard]
+    uvloop = None
+
+try:
+    import httptools  # noqa: F401
+    _HTTP_IMPL = "httptools"
+except ImportError:
+    _HTTP_IMPL = "h11"
+
+_LOOP_IMPL = "uvloop" if uvloop is not None else "asyncio"
+
 # Configure logging to show connection events
 logging.basicConfig(
     level=logging.INFO,
@@ -27,30 +40,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Console banners, built once at import
+_SEP70 = "=" * 70
+_DASH70 = "-" * 70
+
+_HEADER = "\n".join([
+    "",
+    _SEP70,
+    "AIConexus Gateway Server - Listen Mode".center(70),
+    _SEP70,
+    "",
+    "  Gateway is starting and will listen for client connections...",
+    "  Press Ctrl+C to stop the server",
+    "",
+    _DASH70,
+    "",
+    "",
+])
+
+_CONNECTION_INFO = "\n".join([
+    "  Server Address: ws://127.0.0.1:8000/ws",
+    "  Protocol: IoAP v1 (ioap.v1)",
+    "  Started at: {started}",
+    "",
+    "  Waiting for client connections...",
+    "",
+    _DASH70,
+    "",
+    "",
+])
+
+_SHUTDOWN_BANNER = "\n".join(["", _SEP70, "Server shutting down...".center(70), _SEP70, ""])
+_STOPPED_BANNER = "\n".join(["", _SEP70, "Server stopped by user".center(70), _SEP70, "", ""])
+
 
 def print_header():
     """Print server startup header."""
-    print("\n" + "="*70)
-    print("AIConexus Gateway Server - Listen Mode".center(70))
-    print("="*70)
-    print()
-    print("  Gateway is starting and will listen for client connections...")
-    print("  Press Ctrl+C to stop the server")
-    print()
-    print("-"*70)
-    print()
+    sys.stdout.write(_HEADER)
 
 
 def print_connection_info():
     """Print gateway connection info."""
-    print(f"  Server Address: ws://127.0.0.1:8000/ws")
-    print(f"  Protocol: IoAP v1 (ioap.v1)")
-    print(f"  Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
-    print("  Waiting for client connections...")
-    print()
-    print("-"*70)
-    print()
+    sys.stdout.write(_CONNECTION_INFO.format(
+        started=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    ))
 
 
 async def run_server():
@@ -66,16 +99,17 @@ async def run_server():
         host="127.0.0.1",
         port=8000,
         log_level="info",
+        loop=_LOOP_IMPL,
+        http=_HTTP_IMPL,
+        ws="websockets",
+        backlog=4096,
     )
     server = uvicorn.Server(config)
     
     # Setup signal handlers
     def signal_handler(signum, frame):
         logger.info("Shutdown signal received")
-        print()
-        print("="*70)
-        print("Server shutting down...".center(70))
-        print("="*70)
+        sys.stdout.write(_SHUTDOWN_BANNER)
         sys.exit(0)
     
     signal.signal(signal.SIGINT, signal_handler)
@@ -89,14 +123,13 @@ def main():
     print_header()
     print_connection_info()
     
+    if uvloop is not None:
+        uvloop.install()
+    
     try:
         asyncio.run(run_server())
     except KeyboardInterrupt:
-        print()
-        print("="*70)
-        print("Server stopped by user".center(70))
-        print("="*70)
-        print()
+        sys.stdout.write(_STOPPED_BANNER)
         sys.exit(0)
 
 
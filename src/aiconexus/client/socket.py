@@ -8,25 +8,61 @@ Provides:
 - Event handlers for lifecycle
 """
 
-from typing import Callable, Optional, Any, Dict
-from enum import Enum
+from typing import Callable, Optional, Any, Dict, Union
+from enum import Enum, unique
 import asyncio
+import functools
 import json
 import logging
-import uuid
-from datetime import datetime
+import random
 
 import websockets
 from websockets.client import WebSocketClientProtocol
 
-from aiconexus.protocol.models import Message, MessageType, RegisterPayload, ErrorPayload
+from aiconexus.protocol.models import Message, MessageType, ErrorPayload
 from aiconexus.protocol.security import DIDKey, MessageSigner
 from aiconexus.protocol.errors import ProtocolError, ConnectionError
 from aiconexus.protocol.serialization import MessageSerializer
+from aiconexus.utils.ids import new_message_id
+from aiconexus.utils.timeutils import utcnow_iso
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
 
+    _ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+    def _dumps(obj: Any) -> str:
+        # The Gateway reads text frames, so hand websockets a str
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is a core dependency
+    _dumps = MessageSerializer.to_json
+    _loads = json.loads
+
+# Signaling types, matched against the raw "type" field of inbound frames
+_SIGNALING_TYPES = frozenset({
+    MessageType.OFFER.value,
+    MessageType.ANSWER.value,
+    MessageType.ICE_CANDIDATE.value,
+})
+
+_PROTOCOL_VERSION = Message.model_fields["version"].default
+
+# Wire keys every Message must carry; checked before strict validation
+_REQUIRED_KEYS = frozenset(
+    field.alias or name
+    for name, field in Message.model_fields.items()
+    if field.is_required()
+)
+
+# DID the Gateway uses for messages addressed to or from itself
+_GATEWAY_DID = "did:key:gateway"
+
+
+@unique
 class ConnectionState(str, Enum):
     """WebSocket connection states."""
     DISCONNECTED = "DISCONNECTED"
@@ -43,9 +79,10 @@ class GatewayClient:
     Features:
     - Automatic connection management
     - Message serialization/deserialization
-    - Event handler dispatch
+    - Event handler dispatch (concurrent across senders, in arrival order
+      per sender)
     - Connection state tracking
-    - Automatic reconnection with exponential backoff
+    - Automatic reconnection with jittered exponential backoff
     
     Usage:
         from aiconexus.client import GatewayClient
@@ -68,12 +105,43 @@ class GatewayClient:
             # Listen for messages...
     """
     
+    # One client per agent; slots keep per-instance footprint small at scale
+    __slots__ = (
+        "gateway_url",
+        "did_key",
+        "agent_did",
+        "reconnect_interval",
+        "max_reconnect_attempts",
+        "max_backoff",
+        "strict_validation",
+        "state",
+        "_websocket",
+        "_receive_task",
+        "_reconnect_task",
+        "_message_handlers",
+        "_error_handlers",
+        "_sync_message_handlers",
+        "_async_message_handlers",
+        "_blocking_message_handlers",
+        "_sync_error_handlers",
+        "_async_error_handlers",
+        "_registered",
+        "_handler_slots",
+        "_dispatch_tasks",
+        "_sender_tails",
+        "_ping_prefix",
+        "_ping_sequence",
+    )
+    
     def __init__(
         self,
         gateway_url: str,
         did_key: DIDKey,
         reconnect_interval: float = 1.0,
         max_reconnect_attempts: int = 5,
+        max_inflight_handlers: int = 64,
+        max_backoff: float = 30.0,
+        strict_validation: bool = False,
     ):
         """
         Initialize Gateway client.
@@ -83,12 +151,20 @@ class GatewayClient:
             did_key: DIDKey instance for identity and message signing
             reconnect_interval: Initial reconnection interval in seconds
             max_reconnect_attempts: Maximum reconnection attempts (0 = infinite)
+            max_inflight_handlers: Maximum messages being dispatched at once;
+                the receive loop waits for a free slot beyond this
+            max_backoff: Upper bound in seconds for a single reconnect delay
+            strict_validation: Validate every inbound frame against the full
+                Message schema before dispatch (handlers receive the raw dict
+                either way)
         """
         self.gateway_url = gateway_url
         self.did_key = did_key
         self.agent_did = did_key.did
         self.reconnect_interval = reconnect_interval
         self.max_reconnect_attempts = max_reconnect_attempts
+        self.max_backoff = max_backoff
+        self.strict_validation = strict_validation
         
         self.state = ConnectionState.DISCONNECTED
         self._websocket: Optional[WebSocketClientProtocol] = None
@@ -97,21 +173,61 @@ class GatewayClient:
         
         self._message_handlers: list[Callable] = []
         self._error_handlers: list[Callable] = []
+        # Same handlers, split by kind once at registration
+        self._sync_message_handlers: list[Callable] = []
+        self._async_message_handlers: list[Callable] = []
+        self._blocking_message_handlers: list[Callable] = []
+        self._sync_error_handlers: list[Callable] = []
+        self._async_error_handlers: list[Callable] = []
         self._registered = False
+        
+        # In-flight dispatch tasks, bounded so slow handlers apply backpressure
+        self._handler_slots = asyncio.Semaphore(max_inflight_handlers)
+        self._dispatch_tasks: set[asyncio.Task] = set()
+        # Latest dispatch task per sender DID; the next frame from that
+        # sender waits for it, so signaling (OFFER before ICE) stays ordered
+        self._sender_tails: dict[Any, asyncio.Task] = {}
+        
+        # Constant part of every PING frame, minus the closing brace
+        self._ping_prefix = _dumps({
+            "type": MessageType.PING.value,
+            "from": self.agent_did,
+            "to": _GATEWAY_DID,
+            "version": _PROTOCOL_VERSION,
+            "signature": "",
+        })[:-1]
+        self._ping_sequence = 0
     
     @property
     def is_connected(self) -> bool:
         """Whether client is currently connected."""
         return self.state == ConnectionState.CONNECTED and self._websocket is not None
     
-    def on_message(self, handler: Callable[[Dict[str, Any]], None]) -> None:
+    def on_message(
+        self,
+        handler: Callable[[Dict[str, Any]], None],
+        blocking: bool = False,
+    ) -> None:
         """
         Register a message handler.
         
+        Handlers run concurrently with each other and with the receive loop,
+        so they must be safe to re-enter. Frames from the same sender
+        ("from" DID) are dispatched one at a time in arrival order; frames
+        from different senders may be handled out of order.
+        
         Args:
             handler: Async function(message_dict) called on incoming messages
+            blocking: Mark a sync handler as CPU-heavy or blocking; it is then
+                run in the default executor instead of on the event loop
         """
         self._message_handlers.append(handler)
+        if blocking and not asyncio.iscoroutinefunction(handler):
+            self._blocking_message_handlers.append(handler)
+        elif asyncio.iscoroutinefunction(handler):
+            self._async_message_handlers.append(handler)
+        else:
+            self._sync_message_handlers.append(handler)
     
     def on_error(self, handler: Callable[[Exception], None]) -> None:
         """
@@ -121,35 +237,124 @@ class GatewayClient:
             handler: Async function(exception) called on errors
         """
         self._error_handlers.append(handler)
+        if asyncio.iscoroutinefunction(handler):
+            self._async_error_handlers.append(handler)
+        else:
+            self._sync_error_handlers.append(handler)
     
-    async def _set_state(self, new_state: ConnectionState) -> None:
+    def _set_state(self, new_state: ConnectionState) -> None:
         """Update connection state."""
         old_state = self.state
         self.state = new_state
-        logger.debug(f"Connection state: {old_state.value} → {new_state.value}")
+        logger.debug("Connection state: %s → %s", old_state.name, new_state.name)
     
     async def _dispatch_message(self, message_dict: Dict[str, Any]) -> None:
-        """Dispatch message to all registered handlers."""
-        for handler in self._message_handlers:
+        """Dispatch message to sync handlers inline, then the rest concurrently."""
+        errors: list[Exception] = []
+        for handler in self._sync_message_handlers:
             try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(message_dict)
-                else:
-                    handler(message_dict)
+                handler(message_dict)
             except Exception as e:
-                logger.exception(f"Error in message handler: {e}")
-                await self._dispatch_error(e)
+                errors.append(e)
+        
+        if self._async_message_handlers or self._blocking_message_handlers:
+            results = await asyncio.gather(
+                *(handler(message_dict) for handler in self._async_message_handlers),
+                *(
+                    asyncio.to_thread(handler, message_dict)
+                    for handler in self._blocking_message_handlers
+                ),
+                return_exceptions=True,
+            )
+            errors.extend(r for r in results if isinstance(r, Exception))
+        
+        for error in errors:
+            logger.error(f"Error in message handler: {error}", exc_info=error)
+            await self._dispatch_error(error)
+    
+    async def _schedule_dispatch(self, message_dict: Dict[str, Any]) -> None:
+        """
+        Dispatch a message in the background without blocking the receive loop.
+        
+        The task is chained behind the previous frame from the same sender,
+        so each sender's frames are handled in arrival order.
+        """
+        await self._handler_slots.acquire()
+        sender = message_dict.get("from")
+        task = asyncio.create_task(
+            self._dispatch_after(self._sender_tails.get(sender), message_dict)
+        )
+        self._sender_tails[sender] = task
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(functools.partial(self._on_dispatch_done, sender))
+    
+    async def _dispatch_after(
+        self,
+        previous: Optional[asyncio.Task],
+        message_dict: Dict[str, Any],
+    ) -> None:
+        """Wait for the sender's previous frame (however it ended), then dispatch."""
+        if previous is not None and not previous.done():
+            await asyncio.wait((previous,))
+        await self._dispatch_message(message_dict)
+    
+    def _on_dispatch_done(self, sender: Any, task: asyncio.Task) -> None:
+        self._dispatch_tasks.discard(task)
+        if self._sender_tails.get(sender) is task:
+            del self._sender_tails[sender]
+        self._handler_slots.release()
     
     async def _dispatch_error(self, error: Exception) -> None:
         """Dispatch error to all registered handlers."""
-        for handler in self._error_handlers:
+        for handler in self._sync_error_handlers:
             try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(error)
-                else:
-                    handler(error)
+                handler(error)
             except Exception as e:
                 logger.exception(f"Error in error handler: {e}")
+        
+        for handler in self._async_error_handlers:
+            try:
+                await handler(error)
+            except Exception as e:
+                logger.exception(f"Error in error handler: {e}")
+    
+    async def _parse_frame(self, raw_message: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+        """
+        Decode an inbound frame and check its shape.
+        
+        Malformed frames are reported to the error handlers and yield None.
+        With strict_validation, a frame that fails the Message schema raises
+        the validation error.
+        
+        Args:
+            raw_message: Frame as received from the WebSocket
+            
+        Returns:
+            Message dict, or None if the frame was rejected
+        """
+        try:
+            message_dict = _loads(raw_message)
+        except json.JSONDecodeError as e:
+            await self._dispatch_error(ConnectionError(f"Invalid JSON received: {e}"))
+            return None
+        
+        # Reject non-objects without raising through the except path
+        if not isinstance(message_dict, dict):
+            await self._dispatch_error(
+                ProtocolError("Malformed message: expected a JSON object")
+            )
+            return None
+        
+        # Full schema validation is opt-in; handlers only get the dict
+        if self.strict_validation:
+            if not _REQUIRED_KEYS.issubset(message_dict):
+                await self._dispatch_error(
+                    ProtocolError("Malformed message: missing required fields")
+                )
+                return None
+            Message.model_validate(message_dict)
+        
+        return message_dict
     
     async def _receive_messages(self) -> None:
         """
@@ -163,39 +368,30 @@ class GatewayClient:
             
             async for raw_message in self._websocket:
                 try:
-                    # Parse JSON
-                    message_dict = json.loads(raw_message)
-                    
-                    # Validate message structure
-                    message = Message(**message_dict)
+                    message_dict = await self._parse_frame(raw_message)
+                    if message_dict is None:
+                        continue
                     
                     # For signaling messages, verify signature
-                    if message.type in [
-                        MessageType.OFFER,
-                        MessageType.ANSWER,
-                        MessageType.ICE_CANDIDATE,
-                    ]:
+                    if message_dict.get("type") in _SIGNALING_TYPES:
                         # Signature verification would happen here
                         # For now, just validate structure
                         pass
                     
-                    # Dispatch to handlers
-                    await self._dispatch_message(message_dict)
+                    # Dispatch to handlers, then go straight back to recv()
+                    await self._schedule_dispatch(message_dict)
                     
-                except json.JSONDecodeError as e:
-                    error = ConnectionError(f"Invalid JSON received: {e}")
-                    await self._dispatch_error(error)
                 except Exception as e:
                     error = ProtocolError(f"Error processing message: {e}")
                     await self._dispatch_error(error)
         
         except websockets.exceptions.ConnectionClosed:
             logger.info("WebSocket connection closed")
-            await self._set_state(ConnectionState.DISCONNECTED)
+            self._set_state(ConnectionState.DISCONNECTED)
         except Exception as e:
             logger.exception(f"Error in message receive loop: {e}")
             await self._dispatch_error(e)
-            await self._set_state(ConnectionState.ERROR)
+            self._set_state(ConnectionState.ERROR)
     
     async def connect(self, timeout: float = 10.0) -> None:
         """
@@ -214,10 +410,9 @@ class GatewayClient:
             logger.warning("Connection already in progress")
             return
         
-        await self._set_state(ConnectionState.CONNECTING)
+        self._set_state(ConnectionState.CONNECTING)
         
         reconnect_count = 0
-        current_interval = self.reconnect_interval
         
         while True:
             try:
@@ -225,12 +420,15 @@ class GatewayClient:
                 
                 # Connect to WebSocket
                 async with asyncio.timeout(timeout):
+                    # Signaling frames are small JSON; permessage-deflate costs
+                    # more CPU per frame than it saves on the wire
                     self._websocket = await websockets.connect(
                         self.gateway_url,
                         subprotocols=["ioap.v1"],
+                        compression=None,
                     )
                 
-                await self._set_state(ConnectionState.CONNECTED)
+                self._set_state(ConnectionState.CONNECTED)
                 logger.info(f"Connected to Gateway at {self.gateway_url}")
                 
                 # Start message receive loop
@@ -248,30 +446,46 @@ class GatewayClient:
                     error = ConnectionError(
                         f"Failed to connect after {reconnect_count} attempts: {e}"
                     )
-                    await self._set_state(ConnectionState.ERROR)
+                    self._set_state(ConnectionState.ERROR)
                     await self._dispatch_error(error)
                     raise error
                 
+                delay = self._backoff_delay(reconnect_count)
                 logger.warning(
                     f"Connection failed (attempt {reconnect_count}): {e}. "
-                    f"Retrying in {current_interval}s..."
+                    f"Retrying in {delay:.2f}s..."
                 )
                 
-                await asyncio.sleep(current_interval)
-                current_interval = min(current_interval * 2, 30.0)  # Exponential backoff, max 30s
+                await asyncio.sleep(delay)
             
             except Exception as e:
                 error = ConnectionError(f"Unexpected connection error: {e}")
-                await self._set_state(ConnectionState.ERROR)
+                self._set_state(ConnectionState.ERROR)
                 await self._dispatch_error(error)
                 raise error
     
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Compute the delay before reconnect attempt number `attempt`.
+        
+        Uses full jitter: a uniform draw between 0 and the capped exponential
+        backoff, so agents dropped by the same outage don't retry in lockstep.
+        
+        Args:
+            attempt: 1-based count of failed attempts so far
+        
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.max_backoff, self.reconnect_interval * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+    
     async def disconnect(self) -> None:
         """Gracefully disconnect from Gateway."""
         if self.state == ConnectionState.DISCONNECTED:
             return
         
-        await self._set_state(ConnectionState.DISCONNECTING)
+        self._set_state(ConnectionState.DISCONNECTING)
         
         try:
             # Cancel receive task
@@ -290,18 +504,26 @@ class GatewayClient:
                 except asyncio.CancelledError:
                     pass
             
+            # Cancel in-flight handlers (except the caller, if a handler disconnects)
+            current = asyncio.current_task()
+            handler_tasks = [t for t in self._dispatch_tasks if t is not current]
+            for task in handler_tasks:
+                task.cancel()
+            if handler_tasks:
+                await asyncio.gather(*handler_tasks, return_exceptions=True)
+            
             # Close WebSocket
             if self._websocket:
                 await self._websocket.close()
                 self._websocket = None
             
             self._registered = False
-            await self._set_state(ConnectionState.DISCONNECTED)
+            self._set_state(ConnectionState.DISCONNECTED)
             logger.info("Disconnected from Gateway")
         
         except Exception as e:
             logger.exception(f"Error during disconnect: {e}")
-            await self._set_state(ConnectionState.ERROR)
+            self._set_state(ConnectionState.ERROR)
     
     async def register(self, public_key: str) -> None:
         """
@@ -317,36 +539,45 @@ class GatewayClient:
         if not self.is_connected:
             raise ConnectionError("Not connected to Gateway")
         
-        # Create REGISTER message
-        payload = RegisterPayload(public_key=public_key)
-        message = Message(
-            id=str(uuid.uuid4()),
-            type=MessageType.REGISTER,
-            **{"from": self.agent_did, "to": self.agent_did},  # Self-registration
-            payload=payload.model_dump(),
-            timestamp=datetime.utcnow(),
-            signature="",  # Will be filled in below
-        )
-        
-        # Sign message - need to convert to dict with ISO formatted timestamp
-        message_dict = message.model_dump(exclude={'signature'}, by_alias=True)
-        message_dict['timestamp'] = message_dict['timestamp'].isoformat()
-        signature = MessageSigner.sign_message(message_dict, self.did_key)
-        message.signature = signature
-        
-        # Send message
-        send_dict = message.model_dump(by_alias=True)
-        send_dict['timestamp'] = send_dict['timestamp'].isoformat()
-        await self.send(send_dict)
+        send_dict = self._build_register_message(public_key)
+        await self._send_dict(send_dict, MessageType.REGISTER.value)
         self._registered = True
         logger.info(f"Registered with Gateway as {self.agent_did}")
     
-    async def send(self, message: Dict[str, Any]) -> None:
+    def _build_register_message(self, public_key: str) -> Dict[str, Any]:
+        """
+        Build a signed REGISTER message dict.
+        
+        REGISTER has a fixed shape, so the wire dict is written out directly
+        (same keys and order as Message.model_dump(mode='json', by_alias=True))
+        instead of going through the model.
+        
+        Args:
+            public_key: Base58-encoded Ed25519 public key
+        
+        Returns:
+            Message dict ready to send, with signature filled in
+        """
+        message = {
+            "id": new_message_id(),
+            "correlation_id": None,
+            "timestamp": utcnow_iso(),
+            "from": self.agent_did,
+            "to": self.agent_did,  # Self-registration
+            "type": MessageType.REGISTER.value,
+            "payload": {"public_key": public_key},
+            "version": _PROTOCOL_VERSION,
+        }
+        message["signature"] = MessageSigner.sign_message(message, self.did_key)
+        return message
+    
+    async def send(self, message: Union[Message, Dict[str, Any]]) -> None:
         """
         Send a message through Gateway.
         
         Args:
-            message: Message dict (will be validated against Message schema)
+            message: Message instance, or a dict (validated against the
+                Message schema before sending)
         
         Raises:
             ConnectionError: If not connected
@@ -356,17 +587,75 @@ class GatewayClient:
             raise ConnectionError("Not connected to Gateway")
         
         try:
-            # Validate message structure
-            msg_obj = Message(**message)
-            
-            # Serialize and send
-            json_str = MessageSerializer.to_json(msg_obj.model_dump(by_alias=True))
-            
+            # Validate message structure (a Message is already valid)
+            if isinstance(message, Message):
+                msg_obj = message
+            else:
+                msg_obj = Message.model_validate(message)
+        except Exception as e:
+            error = ProtocolError(f"Failed to send message: {e}")
+            await self._dispatch_error(error)
+            raise error
+        
+        await self._send_dict(msg_obj.model_dump(by_alias=True), msg_obj.type.value)
+    
+    async def ping(self) -> int:
+        """
+        Send a PING heartbeat to the Gateway.
+        
+        Keeps this agent's registry entry alive while it is otherwise idle.
+        PING frames have a fixed shape, so they are assembled from a prefix
+        encoded once at construction rather than through the Message model.
+        
+        Returns:
+            Sequence number carried in the PING payload
+        
+        Raises:
+            ConnectionError: If not connected
+            ProtocolError: If the send fails
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to Gateway")
+        
+        self._ping_sequence += 1
+        frame = (
+            f'{self._ping_prefix},"id":"{new_message_id()}",'
+            f'"timestamp":"{utcnow_iso()}",'
+            f'"payload":{{"sequence":{self._ping_sequence}}}}}'
+        )
+        await self._send_frame(frame, MessageType.PING.value)
+        return self._ping_sequence
+    
+    async def _send_dict(self, message_dict: Dict[str, Any], msg_type: str) -> None:
+        """
+        Serialize and send a message dict that is already known to be valid.
+        
+        Args:
+            message_dict: Message dict (aliased field names)
+            msg_type: Message type, for logging
+        
+        Raises:
+            ProtocolError: If the WebSocket send fails
+        """
+        await self._send_frame(_dumps(message_dict), msg_type)
+    
+    async def _send_frame(self, json_str: str, msg_type: str) -> None:
+        """
+        Send an already-serialized message frame.
+        
+        Args:
+            json_str: JSON text of the message
+            msg_type: Message type, for logging
+        
+        Raises:
+            ProtocolError: If the WebSocket send fails
+        """
+        try:
             if not self._websocket:
                 raise ConnectionError("WebSocket not available")
             
             await self._websocket.send(json_str)
-            logger.debug(f"Sent {msg_obj.type.value} message")
+            logger.debug("Sent %s message", msg_type)
         
         except Exception as e:
             error = ProtocolError(f"Failed to send message: {e}")
@@ -1,6 +1,5 @@
 """Configuration management for AIConexus"""
 
-from functools import lru_cache
 from typing import Optional
 
 from pydantic_settings import BaseSettings
@@ -72,11 +71,10 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-@lru_cache()
-def get_settings() -> Settings:
-    """Get cached settings instance"""
-    return Settings()
+# Built once at import; environment and .env are read a single time
+settings = Settings()
 
 
-# Convenience access
-settings = get_settings()
+def get_settings() -> Settings:
+    """Get the shared settings instance"""
+    return settings
@@ -1,13 +1,13 @@
 """Core domain classes for AIConexus"""
 
 from abc import ABC, abstractmethod
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
 
 from aiconexus.types import CapabilitySpec, ReputationScore
+from aiconexus.utils.timeutils import utcnow
 
 
 class Capability(BaseModel):
@@ -31,6 +31,11 @@ class Capability(BaseModel):
 class Agent(ABC):
     """Base class for AI agents in the network"""
 
+    # Agents can number in the millions per registry; keep instances
+    # dict-free. Subclasses must declare __slots__ for their own state too,
+    # or instances get a __dict__ again.
+    __slots__ = ("agent_id", "name", "created_at", "capabilities", "reputation")
+
     def __init__(self, agent_id: Optional[UUID] = None, name: str = "Agent"):
         """
         Initialize an agent.
@@ -41,7 +46,8 @@ class Agent(ABC):
         """
         self.agent_id = agent_id or uuid4()
         self.name = name
-        self.created_at = datetime.utcnow()
+        # Naive UTC, like Message.timestamp and the gateway registry
+        self.created_at = utcnow().replace(tzinfo=None)
         self.capabilities: Dict[str, Capability] = {}
         self.reputation = ReputationScore(agent_id=self.agent_id)
 
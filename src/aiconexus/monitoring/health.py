@@ -5,22 +5,30 @@ Provides health check endpoints and diagnostics for AIConexus.
 
 import logging
 import asyncio
-from typing import Dict, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from datetime import datetime
 
+import orjson
+
+try:
+    import psutil
+except ImportError:  # resource checks report DEGRADED without it
+    psutil = None
+
 logger = logging.getLogger(__name__)
 
 
-class HealthStatus(Enum):
+class HealthStatus(str, Enum):
     """Health status values."""
     HEALTHY = "healthy"
     DEGRADED = "degraded"
     UNHEALTHY = "unhealthy"
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentHealth:
     """Health status of a single component."""
     name: str
@@ -30,7 +38,7 @@ class ComponentHealth:
     check_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheckResult:
     """Result of a health check."""
     status: HealthStatus
@@ -43,12 +51,12 @@ class HealthCheckResult:
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
-            "status": self.status.value,
+            "status": self.status,
             "timestamp": self.timestamp,
             "uptime_seconds": self.uptime_seconds,
             "components": {
                 name: {
-                    "status": comp.status.value,
+                    "status": comp.status,
                     "message": comp.message,
                     "last_check": comp.last_check,
                     "check_count": comp.check_count,
@@ -58,53 +66,90 @@ class HealthCheckResult:
             "checks_passed": self.checks_passed,
             "checks_failed": self.checks_failed,
         }
+    
+    def to_json(self) -> bytes:
+        """Serialize to_dict() as UTF-8 JSON bytes, ready for an HTTP response."""
+        return orjson.dumps(self.to_dict())
 
 
 class HealthChecker:
     """Performs health checks on system components."""
     
-    def __init__(self):
-        """Initialize health checker."""
-        self._checks: Dict[str, callable] = {}
+    # Seconds a check_health() result is reused before the probes run again
+    CACHE_TTL = 1.0
+    
+    def __init__(self, max_concurrent_checks: int = 10):
+        """Initialize health checker.
+        
+        Args:
+            max_concurrent_checks: Maximum number of probes running at once
+        """
+        self._checks: Dict[str, Tuple[callable, float]] = {}
         self._component_health: Dict[str, ComponentHealth] = {}
-        self._start_time = datetime.utcnow()
+        # Flattened view of _checks, rebuilt on registration and iterated per poll
+        self._check_list: List[Tuple[str, callable, float, ComponentHealth]] = []
+        self._start_monotonic = time.monotonic()
+        self._cached_result: Optional[HealthCheckResult] = None
+        self._cache_ts = 0.0
+        self._semaphore = asyncio.Semaphore(max_concurrent_checks)
     
-    def register_check(self, name: str, check_fn: callable):
+    def register_check(self, name: str, check_fn: callable, timeout: float = 2.0):
         """Register a health check function.
         
         Args:
             name: Name of the component
             check_fn: Async function that returns (status, message)
+            timeout: Seconds before the check is reported as timed out
         """
-        self._checks[name] = check_fn
+        self._checks[name] = (check_fn, timeout)
         self._component_health[name] = ComponentHealth(
             name=name,
             status=HealthStatus.HEALTHY,
             message="Not yet checked"
         )
+        self._check_list = [
+            (check_name, fn, check_timeout, self._component_health[check_name])
+            for check_name, (fn, check_timeout) in self._checks.items()
+        ]
+        self._cached_result = None
         logger.debug(f"Registered health check: {name}")
     
-    async def check_health(self) -> HealthCheckResult:
+    async def check_health(self, use_cache: bool = True) -> HealthCheckResult:
         """Perform all health checks.
         
+        Args:
+            use_cache: Return the previous result if it is younger than
+                CACHE_TTL instead of re-running every probe
+        
         Returns:
             HealthCheckResult with status and component details
         """
+        if (
+            use_cache
+            and self._cached_result is not None
+            and time.monotonic() - self._cache_ts < self.CACHE_TTL
+        ):
+            return self._cached_result
+        
         checks_passed = 0
         checks_failed = 0
         
+        # Snapshot, so a check registered mid-poll cannot misalign the results
+        check_list = self._check_list
+        
         # Run all checks concurrently
         check_tasks = [
-            self._run_check(name, check_fn)
-            for name, check_fn in self._checks.items()
+            self._run_check(name, check_fn, timeout)
+            for name, check_fn, timeout, _ in check_list
         ]
         
         results = await asyncio.gather(*check_tasks, return_exceptions=True)
         
+        # One timestamp for every component updated in this pass
+        now_iso = datetime.utcnow().isoformat()
+        
         # Process results
-        for i, (name, check_fn) in enumerate(self._checks.items()):
-            result = results[i]
-            
+        for (_, _, _, component), result in zip(check_list, results, strict=True):
             if isinstance(result, Exception):
                 status = HealthStatus.UNHEALTHY
                 message = f"Check failed with error: {str(result)}"
@@ -117,47 +162,55 @@ class HealthChecker:
                     checks_failed += 1
             
             # Update component health
-            component = self._component_health[name]
             component.status = status
             component.message = message
-            component.last_check = datetime.utcnow().isoformat()
+            component.last_check = now_iso
             component.check_count += 1
         
         # Determine overall status
         if checks_failed == 0:
             overall_status = HealthStatus.HEALTHY
-        elif checks_failed <= len(self._checks) // 2:
+        elif checks_failed <= len(check_list) // 2:
             overall_status = HealthStatus.DEGRADED
         else:
             overall_status = HealthStatus.UNHEALTHY
         
         # Calculate uptime
-        uptime = (datetime.utcnow() - self._start_time).total_seconds()
+        uptime = time.monotonic() - self._start_monotonic
         
-        return HealthCheckResult(
+        result = HealthCheckResult(
             status=overall_status,
+            timestamp=now_iso,
             uptime_seconds=uptime,
-            components=self._component_health.copy(),
+            # Shared with the checker, not a snapshot; treat as read-only
+            components=self._component_health,
             checks_passed=checks_passed,
             checks_failed=checks_failed,
         )
+        self._cached_result = result
+        self._cache_ts = time.monotonic()
+        return result
     
     async def _run_check(
         self,
         name: str,
-        check_fn: callable
+        check_fn: callable,
+        timeout: float = 2.0
     ) -> tuple[HealthStatus, str]:
         """Run a single health check with timeout.
         
         Args:
             name: Component name
             check_fn: Check function
+            timeout: Seconds to wait for the check
             
         Returns:
             Tuple of (status, message)
         """
         try:
-            result = await asyncio.wait_for(check_fn(), timeout=5.0)
+            # The timeout starts once a slot is free, not while queued
+            async with self._semaphore:
+                result = await asyncio.wait_for(check_fn(), timeout=timeout)
             
             if isinstance(result, tuple):
                 return result
@@ -177,13 +230,32 @@ class HealthChecker:
             return HealthStatus.UNHEALTHY, f"Check error: {str(e)}"
 
 
+# Seconds a psutil reading is reused by the default resource checks
+PSUTIL_SAMPLE_TTL = 5.0
+
+# (monotonic time, usage percent) per resource, shared by all checkers
+_psutil_samples: Dict[str, Tuple[float, float]] = {}
+
+
+async def _sampled_percent(resource: str, sample_fn: callable, *args) -> float:
+    """Return a psutil usage percent, reusing a recent reading if one exists."""
+    now = time.monotonic()
+    cached = _psutil_samples.get(resource)
+    if cached is not None and now - cached[0] < PSUTIL_SAMPLE_TTL:
+        return cached[1]
+    
+    percent = (await asyncio.to_thread(sample_fn, *args)).percent
+    _psutil_samples[resource] = (now, percent)
+    return percent
+
+
 # Default health checks
 async def check_memory() -> tuple[HealthStatus, str]:
     """Check available memory."""
+    if psutil is None:
+        return HealthStatus.DEGRADED, "Could not check memory: psutil not installed"
     try:
-        import psutil
-        memory = psutil.virtual_memory()
-        percent = memory.percent
+        percent = await _sampled_percent("memory", psutil.virtual_memory)
         
         if percent > 90:
             return HealthStatus.UNHEALTHY, f"Memory usage critical: {percent}%"
@@ -197,10 +269,10 @@ async def check_memory() -> tuple[HealthStatus, str]:
 
 async def check_disk() -> tuple[HealthStatus, str]:
     """Check available disk space."""
+    if psutil is None:
+        return HealthStatus.DEGRADED, "Could not check disk: psutil not installed"
     try:
-        import psutil
-        disk = psutil.disk_usage('/')
-        percent = disk.percent
+        percent = await _sampled_percent("disk", psutil.disk_usage, '/')
         
         if percent > 95:
             return HealthStatus.UNHEALTHY, f"Disk usage critical: {percent}%"
@@ -215,12 +287,19 @@ async def check_disk() -> tuple[HealthStatus, str]:
 async def check_network() -> tuple[HealthStatus, str]:
     """Check network connectivity."""
     try:
-        import socket
-        socket.create_connection(("1.1.1.1", 80), timeout=2)
+        # Non-blocking connect, kept inside the 1s budget the default checker gives it
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection("1.1.1.1", 80), timeout=0.8
+        )
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass  # Connected already; a reset while closing doesn't matter
         return HealthStatus.HEALTHY, "Network connectivity OK"
-    except socket.timeout:
+    except asyncio.TimeoutError:
         return HealthStatus.DEGRADED, "Network timeout"
-    except socket.error:
+    except OSError:
         return HealthStatus.UNHEALTHY, "Network unreachable"
     except Exception as e:
         return HealthStatus.DEGRADED, f"Network check error: {e}"
@@ -241,9 +320,10 @@ def get_checker() -> HealthChecker:
         _health_checker = HealthChecker()
         
         # Register default checks
-        _health_checker.register_check("memory", check_memory)
-        _health_checker.register_check("disk", check_disk)
-        _health_checker.register_check("network", check_network)
+        # Local syscalls get a tight budget; the network probe a little more
+        _health_checker.register_check("memory", check_memory, timeout=0.5)
+        _health_checker.register_check("disk", check_disk, timeout=0.5)
+        _health_checker.register_check("network", check_network, timeout=1.0)
         
         logger.info("Initialized global health checker")
     return _health_checker
@@ -253,3 +333,4 @@ def reset_checker():
     """Reset global health checker (for testing)."""
     global _health_checker
     _health_checker = None
+    _psutil_samples.clear()
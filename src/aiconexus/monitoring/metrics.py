@@ -8,9 +8,11 @@ Provides metrics for:
 - System resource usage
 """
 
+import io
 import time
 import logging
-from typing import Dict, Optional, Callable
+from collections import deque
+from typing import Dict, FrozenSet, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -25,34 +27,57 @@ class MetricType(Enum):
     SUMMARY = "summary"
 
 
-@dataclass
-class MetricValue:
-    """A single metric value with timestamp."""
-    value: float
-    timestamp: float = field(default_factory=time.time)
-    labels: Dict[str, str] = field(default_factory=dict)
+# Identifies one label set of a metric, independent of label order
+LabelKey = FrozenSet[Tuple[str, str]]
 
 
-@dataclass
+def _render_labels(key: LabelKey) -> str:
+    """Render a label set in Prometheus exposition format."""
+    if not key:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in sorted(key)) + "}"
+
+
+@dataclass(slots=True)
 class Metric:
     """Metric definition and values."""
     name: str
     description: str
     metric_type: MetricType
-    values: Dict[str, MetricValue] = field(default_factory=dict)
+    # Current value per label set; labels are recoverable with dict(key)
+    values: Dict[LabelKey, float] = field(default_factory=dict)
+    header: str = field(init=False, repr=False)
+    # Prometheus label block ('{k="v",...}' or "") per label set, rendered once
+    label_blocks: Dict[LabelKey, str] = field(default_factory=dict, repr=False)
+    
+    def __post_init__(self):
+        """Build the HELP/TYPE preamble once; it never changes."""
+        self.header = (
+            f"# HELP {self.name} {self.description}\n"
+            f"# TYPE {self.name} {self.metric_type.value}\n"
+        )
     
     def record(self, value: float, labels: Optional[Dict[str, str]] = None):
         """Record a metric value."""
         key = self._make_key(labels or {})
-        self.values[key] = MetricValue(value=value, labels=labels or {})
+        if key not in self.label_blocks:
+            self.label_blocks[key] = _render_labels(key)
+        self.values[key] = value
+    
+    def inc(self, delta: float = 1.0, labels: Optional[Dict[str, str]] = None):
+        """Add to the value for a label set (counter fast path)."""
+        key = self._make_key(labels or {})
+        current = self.values.get(key)
+        if current is None:
+            self.label_blocks[key] = _render_labels(key)
+            self.values[key] = delta
+        else:
+            self.values[key] = current + delta
     
     @staticmethod
-    def _make_key(labels: Dict[str, str]) -> str:
-        """Create a key from labels."""
-        if not labels:
-            return "no_labels"
-        items = sorted(labels.items())
-        return ",".join(f"{k}={v}" for k, v in items)
+    def _make_key(labels: Dict[str, str]) -> LabelKey:
+        """Create an order-independent key from labels (no sort, no string build)."""
+        return frozenset(labels.items())
 
 
 class MetricsCollector:
@@ -176,6 +201,26 @@ class MetricsCollector:
         
         self.metrics[metric_name].record(value, labels)
     
+    def inc(
+        self,
+        metric_name: str,
+        delta: float = 1.0,
+        labels: Optional[Dict[str, str]] = None
+    ):
+        """Increment a counter metric.
+        
+        Args:
+            metric_name: Name of the metric
+            delta: Amount to add
+            labels: Optional labels for the metric
+        """
+        metric = self.metrics.get(metric_name)
+        if metric is None:
+            logger.warning(f"Unknown metric: {metric_name}")
+            return
+        
+        metric.inc(delta, labels)
+    
     def get_metric(self, metric_name: str) -> Optional[Metric]:
         """Get a metric by name.
         
@@ -201,26 +246,21 @@ class MetricsCollector:
         Returns:
             Metrics in Prometheus format
         """
-        lines = []
+        buf = io.StringIO()
         
         for metric_name, metric in sorted(self.metrics.items()):
-            # Add HELP and TYPE lines
-            lines.append(f"# HELP {metric_name} {metric.description}")
-            lines.append(f"# TYPE {metric_name} {metric.metric_type.value}")
+            # HELP and TYPE lines are prebuilt at registration
+            buf.write(metric.header)
             
-            # Add metric values
-            for value in metric.values.values():
-                labels_str = ""
-                if value.labels:
-                    label_parts = [f'{k}="{v}"' for k, v in sorted(value.labels.items())]
-                    labels_str = "{" + ",".join(label_parts) + "}"
-                
-                line = f"{metric_name}{labels_str} {value.value}"
-                lines.append(line)
+            # Label blocks are prebuilt at record time
+            label_blocks = metric.label_blocks
+            for key, value in metric.values.items():
+                buf.write(f"{metric_name}{label_blocks[key]} {value}\n")
             
-            lines.append("")
+            buf.write("\n")
         
-        return "\n".join(lines)
+        # Blocks are blank-line separated, with no blank line after the last
+        return buf.getvalue()[:-1]
     
     def uptime_seconds(self) -> float:
         """Get uptime in seconds.
@@ -242,7 +282,6 @@ class ConnectionMetrics:
         """
         self.collector = collector
         self._active_connections = 0
-        self._total_connections = 0
     
     def connection_started(self):
         """Record start of connection attempt."""
@@ -258,11 +297,7 @@ class ConnectionMetrics:
             "webrtc_connection_time_seconds",
             duration_seconds
         )
-        self._total_connections += 1
-        self.collector.record(
-            "webrtc_peer_connections_total",
-            float(self._total_connections)
-        )
+        self.collector.inc("webrtc_peer_connections_total")
         self.collector.record(
             "webrtc_peer_connections_active",
             float(self._active_connections)
@@ -302,8 +337,8 @@ class MessageMetrics:
         Args:
             size_bytes: Size of message in bytes
         """
-        self.collector.record("webrtc_messages_sent_total", 1)
-        self.collector.record("webrtc_message_bytes_sent_total", float(size_bytes))
+        self.collector.inc("webrtc_messages_sent_total")
+        self.collector.inc("webrtc_message_bytes_sent_total", float(size_bytes))
     
     def message_received(self, size_bytes: int):
         """Record received message.
@@ -311,8 +346,8 @@ class MessageMetrics:
         Args:
             size_bytes: Size of message in bytes
         """
-        self.collector.record("webrtc_messages_received_total", 1)
-        self.collector.record("webrtc_message_bytes_received_total", float(size_bytes))
+        self.collector.inc("webrtc_messages_received_total")
+        self.collector.inc("webrtc_message_bytes_received_total", float(size_bytes))
 
 
 class ErrorMetrics:
@@ -325,9 +360,8 @@ class ErrorMetrics:
             collector: MetricsCollector instance
         """
         self.collector = collector
-        self._error_count = 0
-        self._last_minute_errors = 0
-        self._last_minute_reset = time.time()
+        # Monotonic times of recent errors, oldest first
+        self._error_times: deque = deque(maxlen=10000)
     
     def error_occurred(self, error_type: str = "unknown"):
         """Record error occurrence.
@@ -335,23 +369,21 @@ class ErrorMetrics:
         Args:
             error_type: Type of error
         """
-        self._error_count += 1
-        self._last_minute_errors += 1
+        self._error_times.append(time.monotonic())
         
-        self.collector.record(
+        self.collector.inc(
             "webrtc_errors_total",
-            float(self._error_count),
             labels={"error_type": error_type}
         )
     
     def update_error_rate(self):
-        """Update error rate metric."""
-        current_time = time.time()
-        if current_time - self._last_minute_reset >= 60:
-            error_rate = self._last_minute_errors / 60.0
-            self.collector.record("webrtc_error_rate", error_rate)
-            self._last_minute_errors = 0
-            self._last_minute_reset = current_time
+        """Update error rate metric from errors in the last minute (sliding window)."""
+        cutoff = time.monotonic() - 60.0
+        error_times = self._error_times
+        while error_times and error_times[0] < cutoff:
+            error_times.popleft()
+        
+        self.collector.record("webrtc_error_rate", len(error_times) / 60.0)
 
 
 class RetryMetrics:
@@ -370,10 +402,7 @@ class RetryMetrics:
     def retry_attempted(self):
         """Record retry attempt."""
         self._total_retries += 1
-        self.collector.record(
-            "webrtc_connection_retries_total",
-            float(self._total_retries)
-        )
+        self.collector.inc("webrtc_connection_retries_total")
     
     def retry_succeeded(self):
         """Record successful retry."""
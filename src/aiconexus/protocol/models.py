@@ -6,9 +6,9 @@ and the gateway over WebSocket (signaling) and DataChannel (P2P).
 """
 
 from enum import Enum
-from typing import Optional, Any, Dict, Union
+from typing import Optional, Any, Dict, Type, Union
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, ValidationInfo, field_validator
 
 
 class MessageType(str, Enum):
@@ -119,6 +119,23 @@ class PongPayload(BasePayload):
     sequence: Optional[int] = Field(None, description="Echo of PING sequence number")
 
 
+# Payload model for each message type; lets Message validate a payload
+# against the one model its type calls for instead of trying every variant
+_PAYLOAD_MODELS: Dict[MessageType, Type[BasePayload]] = {
+    MessageType.REGISTER: RegisterPayload,
+    MessageType.UNREGISTER: UnregisterPayload,
+    MessageType.OFFER: OfferPayload,
+    MessageType.ANSWER: AnswerPayload,
+    MessageType.ICE_CANDIDATE: ICECandidatePayload,
+    MessageType.INTENT: IntentPayload,
+    MessageType.EXEC_REQUEST: ExecRequestPayload,
+    MessageType.EXEC_RESPONSE: ExecResponsePayload,
+    MessageType.ERROR: ErrorPayload,
+    MessageType.PING: PingPayload,
+    MessageType.PONG: PongPayload,
+}
+
+
 class Message(BaseModel):
     """
     Standard message format for IoAP Protocol.
@@ -147,6 +164,9 @@ class Message(BaseModel):
     version: str = Field("1.0", description="Protocol version")
     signature: str = Field(..., description="Base64-encoded Ed25519 signature")
 
+    # dict_for_signature, built on first access
+    _signature_dict: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
     class Config:
         populate_by_name = True
         use_enum_values = False
@@ -166,12 +186,34 @@ class Message(BaseModel):
             }
         }
 
+    @field_validator("payload", mode="wrap")
+    @classmethod
+    def _validate_payload_for_type(cls, value: Any, handler, info: ValidationInfo) -> Any:
+        """Validate a raw payload against the model for the message type."""
+        model = _PAYLOAD_MODELS.get(info.data.get("type"))
+        if model is None or not isinstance(value, dict):
+            # Unknown type or an already-built payload: fall back to the union
+            return handler(value)
+        return model.model_validate(value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "signature" and not name.startswith("_"):
+            # A signed field changed: rebuild dict_for_signature on next access
+            self._signature_dict = None
+
     @property
     def dict_for_signature(self) -> Dict[str, Any]:
         """
         Return message as dict without signature field.
         Used for signature computation and verification.
+        
+        The dump is cached until a field is reassigned on the message;
+        each call returns a fresh top-level dict. Nested values (payload
+        contents) are shared with the cache and must not be mutated.
         """
-        data = self.model_dump(by_alias=True, exclude_none=False)
-        data.pop("signature", None)
-        return data
+        if self._signature_dict is None:
+            self._signature_dict = self.model_dump(
+                by_alias=True, exclude_none=False, exclude={"signature"}
+            )
+        return dict(self._signature_dict)
@@ -4,13 +4,23 @@ Security operations for IoAP Protocol.
 Handles DID generation, Ed25519 signing/verification, and key management.
 """
 
-import json
-import base64
+from functools import lru_cache
 from typing import Tuple, Dict, Any
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.backends import default_backend
-import base58
+
+try:
+    import based58 as base58  # Rust implementation, same b58encode/b58decode API
+except ImportError:
+    import base58
+
+try:
+    import pybase64 as base64  # SIMD codec, drop-in for the stdlib module
+except ImportError:
+    import base64
+
+from .serialization import CanonicalJSON
 
 
 class DIDKey:
@@ -33,6 +43,14 @@ class DIDKey:
         """
         self._private_key = private_key
         self._public_key = private_key.public_key()
+        
+        # Keys are immutable, so derive the public encodings once
+        self._public_key_bytes = self._public_key.public_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PublicFormat.Raw
+        )
+        self._public_key_base58 = base58.b58encode(self._public_key_bytes).decode("ascii")
+        self._did = f"{self.PREFIX}{self._public_key_base58}"
     
     @classmethod
     def generate(cls) -> "DIDKey":
@@ -83,25 +101,17 @@ class DIDKey:
         Returns:
             DID string in format did:key:z6Mk<base58_pubkey>
         """
-        public_bytes = self._public_key.public_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PublicFormat.Raw
-        )
-        base58_encoded = base58.b58encode(public_bytes).decode("ascii")
-        return f"{self.PREFIX}{base58_encoded}"
+        return self._did
     
     @property
     def public_key_bytes(self) -> bytes:
         """Get the public key as raw bytes (32 bytes for Ed25519)."""
-        return self._public_key.public_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PublicFormat.Raw
-        )
+        return self._public_key_bytes
     
     @property
     def public_key_base58(self) -> str:
         """Get the public key as base58-encoded string."""
-        return base58.b58encode(self.public_key_bytes).decode("ascii")
+        return self._public_key_base58
     
     @property
     def private_key_bytes(self) -> bytes:
@@ -163,7 +173,7 @@ class MessageSigner:
         Returns:
             Canonical JSON string
         """
-        return json.dumps(data, separators=(",", ":"), sort_keys=True)
+        return CanonicalJSON.dumps(data)
     
     @staticmethod
     def sign_message(
@@ -180,8 +190,7 @@ class MessageSigner:
         Returns:
             Base64-encoded signature string
         """
-        canonical = MessageSigner.canonical_json(message_dict)
-        signature_bytes = did_key.sign(canonical.encode("utf-8"))
+        signature_bytes = did_key.sign(CanonicalJSON.encode(message_dict))
         return base64.b64encode(signature_bytes).decode("ascii")
     
     @staticmethod
@@ -206,23 +215,30 @@ class MessageSigner:
             if not from_did.startswith(DIDKey.PREFIX):
                 return False
             
-            base58_key = from_did[len(DIDKey.PREFIX):]
-            public_key_bytes = base58.b58decode(base58_key)
-            
-            # Reconstruct public key
-            public_key = ed25519.Ed25519PublicKey.from_public_bytes(public_key_bytes)
-            
-            # Canonicalize message
-            canonical = MessageSigner.canonical_json(message_dict)
+            public_key = _public_key_from_did(from_did)
             
-            # Verify signature
+            # Verify signature over the canonical bytes
             signature_bytes = base64.b64decode(signature_b64)
-            public_key.verify(signature_bytes, canonical.encode("utf-8"))
+            public_key.verify(signature_bytes, CanonicalJSON.encode(message_dict))
             return True
         except Exception:
             return False
 
 
+@lru_cache(maxsize=4096)
+def _public_key_from_did(did: str) -> ed25519.Ed25519PublicKey:
+    """
+    Decode the Ed25519 public key embedded in a did:key DID.
+    
+    Cached because the same peers sign many messages and base58
+    decoding is pure Python.
+    """
+    base58_key = did[len(DIDKey.PREFIX):]
+    return ed25519.Ed25519PublicKey.from_public_bytes(
+        base58.b58decode(base58_key.encode("ascii"))
+    )
+
+
 class SecurityError(Exception):
     """Raised when a security operation fails."""
     pass
@@ -5,8 +5,58 @@ Handles JSON parsing and canonical representation for messages.
 """
 
 import json
+import re
+from enum import Enum
 from typing import Dict, Any
-from datetime import datetime
+
+import orjson
+
+# A number token with a fraction or exponent, i.e. a float. orjson and
+# json pick different notations for some floats ("1e16" vs "1e+16"), so
+# any float sends canonical encoding to json. A match inside a string
+# only costs a fallback.
+_FLOAT = re.compile(rb"[:,\[]-?\d+[.e]")
+
+_DATETIME_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+# Hand datetimes, dataclasses and builtin subclasses back as TypeError
+# (json rejects or renders them differently), so they fall back to json
+_CANONICAL_OPTIONS = (
+    orjson.OPT_SORT_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+)
+
+_JSON_SCALARS = frozenset({str, int, bool, type(None)})
+
+
+def _orjson_safe(obj: Any) -> bool:
+    """
+    Check that orjson will encode obj exactly like json.dumps.
+    
+    False for non-finite floats (orjson writes them as null, json as
+    NaN/Infinity) and for types orjson encodes natively but json
+    rejects (UUID, plain Enum, ...). str/int Enums encode the same.
+    """
+    stack = [obj]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        o = pop()
+        t = type(o)
+        if t in _JSON_SCALARS:
+            continue
+        if t is dict:
+            extend(o.values())
+        elif t is list or t is tuple:
+            extend(o)
+        elif t is float:
+            if o - o != 0.0:  # nan or +/-inf
+                return False
+        elif not (isinstance(o, Enum) and isinstance(o, (str, int))):
+            return False
+    return True
 
 
 class SerializationError(Exception):
@@ -21,6 +71,33 @@ class CanonicalJSON:
     Ensures deterministic output regardless of input order.
     """
     
+    @staticmethod
+    def encode(obj: Dict[str, Any]) -> bytes:
+        """
+        Serialize to canonical JSON bytes (the form that gets signed).
+        
+        Uses orjson, falling back to json.dumps whenever orjson's output
+        could differ from it (non-ASCII or DEL characters, floats,
+        non-finite floats, non-JSON types), so signatures stay
+        byte-compatible and unsupported types raise json's TypeError.
+        
+        Args:
+            obj: Object to serialize
+            
+        Returns:
+            Canonical JSON as ASCII bytes
+        """
+        out = None
+        if _orjson_safe(obj):
+            try:
+                out = orjson.dumps(obj, option=_CANONICAL_OPTIONS)
+            except TypeError:
+                pass
+        
+        if out is None or not out.isascii() or b"\x7f" in out or _FLOAT.search(out):
+            out = json.dumps(obj, separators=(",", ":"), sort_keys=True).encode("ascii")
+        return out
+    
     @staticmethod
     def dumps(obj: Dict[str, Any], **kwargs) -> str:
         """
@@ -33,7 +110,7 @@ class CanonicalJSON:
         Returns:
             Canonical JSON string (sorted keys, minimal spacing)
         """
-        return json.dumps(obj, separators=(",", ":"), sort_keys=True)
+        return CanonicalJSON.encode(obj).decode("ascii")
     
     @staticmethod
     def loads(s: str) -> Dict[str, Any]:
@@ -59,15 +136,16 @@ class MessageSerializer:
         """
         Serialize message to JSON.
         
+        datetime values are written natively by orjson as ISO 8601 with a
+        ``Z`` suffix (naive values are taken as UTC).
+        
         Args:
             message_dict: Message dictionary
             
         Returns:
             JSON string
         """
-        # Convert datetime objects to ISO format strings
-        data = MessageSerializer._serialize_datetime(message_dict)
-        return json.dumps(data, default=str)
+        return orjson.dumps(message_dict, default=str, option=_DATETIME_OPTIONS).decode()
     
     @staticmethod
     def from_json(json_str: str) -> Dict[str, Any]:
@@ -81,21 +159,6 @@ class MessageSerializer:
             Message dictionary
         """
         try:
-            data = json.loads(json_str)
-            return data
-        except json.JSONDecodeError as e:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError as e:
             raise SerializationError(f"Invalid JSON: {e}")
-    
-    @staticmethod
-    def _serialize_datetime(obj: Any) -> Any:
-        """
-        Recursively convert datetime objects to ISO format strings.
-        """
-        if isinstance(obj, dict):
-            return {k: MessageSerializer._serialize_datetime(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [MessageSerializer._serialize_datetime(item) for item in obj]
-        elif isinstance(obj, datetime):
-            return obj.isoformat() + "Z"
-        else:
-            return obj
@@ -5,10 +5,14 @@ This is THE API that developers use - everything else is hidden inside.
 It provides a simple, powerful interface for creating agents.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Mapping, Optional, Tuple
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+import fnmatch
 import logging
 import asyncio
-from datetime import datetime
+import re
+import time
 
 from .types import (
     ExpertiseArea,
@@ -26,6 +30,77 @@ from .executor import ReActExecutor
 
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 70
+
+_DELEGATION_INFO = """
+You have tools to collaborate with other agents:
+- find_experts: Search for agents with specific expertise
+- validate_message: Verify message format
+- send_message: Contact one agent
+- send_messages_parallel: Contact multiple agents simultaneously
+
+When you need expertise outside your domain:
+1. Use find_experts() to find relevant specialists
+2. Formulate a clear request
+3. Use send_message() or send_messages_parallel() to contact them
+4. Integrate their responses into your solution
+"""
+
+
+# Distinct (model, temperature) ChatOpenAI clients kept alive at once
+LLM_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=LLM_CACHE_SIZE)
+def _get_chat_openai(model_name: str, temperature: float) -> Any:
+    """
+    ChatOpenAI client shared by every agent with the same model config
+    
+    The instance is shared, so it must not be mutated (callbacks,
+    attributes): bind_tools()/with_config() return new runnables and are
+    fine. Agents that need a private, configurable client pass llm=.
+    Least recently used configs are evicted past LLM_CACHE_SIZE;
+    _get_chat_openai.cache_clear() drops them all.
+    """
+    from langchain_openai import ChatOpenAI
+    
+    logger.info("Creating ChatOpenAI LLM: %s", model_name)
+    return ChatOpenAI(
+        model_name=model_name,
+        temperature=temperature
+    )
+
+
+@lru_cache(maxsize=256)
+def _render_system_prompt(
+    name: str,
+    expertise: Tuple[Tuple[str, float], ...],
+    auto_delegation: bool
+) -> str:
+    """Render the default system prompt (cached per name/expertise/delegation)"""
+    expertise_str = "\n".join([
+        f"  - {domain} (confidence: {confidence:.1%})"
+        for domain, confidence in expertise
+    ])
+    
+    delegation_info = _DELEGATION_INFO if auto_delegation else ""
+    
+    return f"""You are an expert agent named '{name}'.
+
+Your Areas of Expertise:
+{expertise_str}
+
+You are autonomous and should leverage your skills to solve problems.
+Be honest about limitations and delegate to specialists when needed.{delegation_info}
+
+Approach:
+1. Analyze the task carefully
+2. Identify required subtasks
+3. Use available tools (including agent collaboration)
+4. Synthesize a comprehensive solution
+5. Provide clear reasoning
+"""
+
 
 class SDKAgent:
     """
@@ -64,7 +139,9 @@ class SDKAgent:
         Args:
             name: Agent name
             expertise: List of expertise areas
-            llm: LLM instance (if None, creates one)
+            llm: LLM instance (if None, uses a ChatOpenAI client shared
+                with other agents of the same model/temperature, which
+                must not be mutated)
             llm_model: Model name (ignored if llm provided)
             temperature: LLM temperature
             gateway_url: Gateway URL for agent discovery
@@ -90,34 +167,34 @@ class SDKAgent:
         self.force_synthetic_tools = force_synthetic_tools
         self.verbose = verbose
         
-        logger.info(f"Initializing SDKAgent: {name}")
-        logger.info(f"  Expertise: {[e.domain for e in expertise]}")
-        logger.info(f"  LLM Model: {llm_model}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Initializing SDKAgent: %s", name)
+            logger.info("  Expertise: %s", [e.domain for e in expertise])
+            logger.info("  LLM Model: %s", llm_model)
         
         # ===== LAYER 1: LLM Setup =====
         self.llm = llm or self._create_llm(llm_model, temperature)
         
         # ===== LAYER 2: SDK Orchestrator =====
-        self.sdk = SDKOrchestrator(
-            gateway_url=gateway_url,
-            agent_id=name
-        )
+        # Built on first use (see the sdk property)
         
         # ===== LAYER 3: Schemas =====
         self.input_schema = input_schema or self._default_input_schema()
         self.output_schema = output_schema or self._default_output_schema()
         
         # ===== LAYER 4: Tools =====
+        # The tool list is built on first use (see the tools property)
         self.custom_tools = custom_tools or []
-        self.tools = self._build_tools()
         
         # ===== LAYER 5: System Prompt =====
         self.system_prompt = system_prompt or self._generate_system_prompt()
         
         # ===== LAYER 6: ReAct Executor =====
         self.executor: Optional[ReActExecutor] = None
+        # Serializes executor creation across concurrent execute() calls
+        self._executor_lock = asyncio.Lock()
         
-        logger.info(f"✅ SDKAgent '{name}' initialized successfully")
+        logger.info("✅ SDKAgent '%s' initialized successfully", name)
     
     async def execute(self, task: str, context: Optional[Dict[str, Any]] = None) -> AgentResult:
         """
@@ -133,25 +210,33 @@ class SDKAgent:
             AgentResult with answer, reasoning steps, tool calls, etc
         """
         
-        logger.info(f"\n{'='*70}")
-        logger.info(f"🚀 Executing task with agent '{self.name}'")
-        logger.info(f"{'='*70}")
-        logger.info(f"Task: {task}")
-        if context:
-            logger.info(f"Context: {context}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", _BANNER)
+            logger.info("🚀 Executing task with agent '%s'", self.name)
+            logger.info(_BANNER)
+            logger.info("Task: %s", task)
+            if context:
+                logger.info("Context: %s", context)
+        
+        delegate_to = self.match_delegation(task)
+        if delegate_to:
+            logger.info("Delegation rule matched: %s", delegate_to)
+            context = {**(context or {}), "delegate_to": delegate_to}
         
         try:
-            # Create executor if not exists
+            # Create executor if not exists (once, even under concurrent calls)
             if self.executor is None:
-                self.executor = await self.sdk.create_react_executor(
-                    llm=self.llm,
-                    system_prompt=self.system_prompt,
-                    tools=self.tools,
-                    max_iterations=self.max_iterations
-                )
+                async with self._executor_lock:
+                    if self.executor is None:
+                        self.executor = await self.sdk.create_react_executor(
+                            llm=self.llm,
+                            system_prompt=self.system_prompt,
+                            tools=self.tools,
+                            max_iterations=self.max_iterations
+                        )
             
             # Run ReAct loop
-            start_time = datetime.utcnow()
+            start_ns = time.perf_counter_ns()
             
             result = await self.executor.run(
                 task=task,
@@ -159,7 +244,7 @@ class SDKAgent:
                 source_agent_id=self.name
             )
             
-            execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e6
             
             # Convert to AgentResult
             agent_result = AgentResult(
@@ -172,14 +257,15 @@ class SDKAgent:
                 execution_time_ms=execution_time
             )
             
-            logger.info(f"\n✅ Task completed successfully")
-            logger.info(f"⏱️  Total time: {execution_time:.0f}ms")
-            logger.info(f"{'='*70}\n")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\n✅ Task completed successfully")
+                logger.info("⏱️  Total time: %.0fms", execution_time)
+                logger.info("%s\n", _BANNER)
             
             return agent_result
         
         except Exception as e:
-            logger.error(f"❌ Error executing task: {str(e)}")
+            logger.error("❌ Error executing task: %s", e)
             
             return AgentResult(
                 answer=None,
@@ -188,18 +274,70 @@ class SDKAgent:
                 execution_time_ms=0
             )
     
+    # ========== DELEGATION RULES ==========
+    
+    @property
+    def delegation_rules(self) -> Mapping[str, str]:
+        """Glob pattern -> agent_id rules (read-only; assign to replace them)"""
+        return self._delegation_rules
+    
+    @delegation_rules.setter
+    def delegation_rules(self, rules: Dict[str, str]) -> None:
+        self._delegation_rules = MappingProxyType(dict(rules))
+        self._delegation_re, self._delegation_targets = self._compile_delegation_rules(
+            self._delegation_rules
+        )
+    
+    # ========== LAZY COMPONENTS ==========
+    
+    @cached_property
+    def sdk(self) -> SDKOrchestrator:
+        """SDK orchestrator, created on first use"""
+        return SDKOrchestrator(
+            gateway_url=self.gateway_url,
+            agent_id=self.name
+        )
+    
+    @cached_property
+    def tools(self) -> List[Tool]:
+        """Tools available to the agent, built on first use"""
+        return self._build_tools()
+    
+    @cached_property
+    def _tools_summary(self) -> List[Dict[str, str]]:
+        """Name/description pairs for self.tools"""
+        return [
+            {
+                "name": tool.name,
+                "description": tool.description
+            }
+            for tool in self.tools
+        ]
+    
     # ========== PRIVATE METHODS ==========
     
+    @staticmethod
+    def _compile_delegation_rules(rules: Mapping[str, str]):
+        """
+        Compile glob delegation rules into one alternation regex
+        
+        Each pattern becomes a named group, so a single match tells which
+        rule fired (the first matching rule wins). Matching is
+        case-sensitive, like fnmatch.fnmatchcase.
+        """
+        if not rules:
+            return None, []
+        
+        pattern = "|".join(
+            f"(?P<r{i}>{fnmatch.translate(glob)})"
+            for i, glob in enumerate(rules)
+        )
+        return re.compile(pattern), list(rules.values())
+    
     def _create_llm(self, model_name: str, temperature: float) -> Any:
         """Create an LLM instance"""
         try:
-            from langchain_openai import ChatOpenAI
-            
-            logger.info(f"Creating ChatOpenAI LLM: {model_name}")
-            return ChatOpenAI(
-                model_name=model_name,
-                temperature=temperature
-            )
+            return _get_chat_openai(model_name, temperature)
         except ImportError:
             logger.warning("langchain_openai not installed, using mock LLM")
             return self._create_mock_llm()
@@ -299,42 +437,11 @@ class SDKAgent:
     
     def _generate_system_prompt(self) -> str:
         """Generate system prompt"""
-        expertise_str = "\n".join([
-            f"  - {e.domain} (confidence: {e.confidence:.1%})"
-            for e in self.expertise
-        ])
-        
-        delegation_info = ""
-        if self.auto_delegation:
-            delegation_info = """
-You have tools to collaborate with other agents:
-- find_experts: Search for agents with specific expertise
-- validate_message: Verify message format
-- send_message: Contact one agent
-- send_messages_parallel: Contact multiple agents simultaneously
-
-When you need expertise outside your domain:
-1. Use find_experts() to find relevant specialists
-2. Formulate a clear request
-3. Use send_message() or send_messages_parallel() to contact them
-4. Integrate their responses into your solution
-"""
-        
-        return f"""You are an expert agent named '{self.name}'.
-
-Your Areas of Expertise:
-{expertise_str}
-
-You are autonomous and should leverage your skills to solve problems.
-Be honest about limitations and delegate to specialists when needed.{delegation_info}
-
-Approach:
-1. Analyze the task carefully
-2. Identify required subtasks
-3. Use available tools (including agent collaboration)
-4. Synthesize a comprehensive solution
-5. Provide clear reasoning
-"""
+        return _render_system_prompt(
+            self.name,
+            tuple((e.domain, e.confidence) for e in self.expertise),
+            self.auto_delegation
+        )
     
     # ========== PUBLIC UTILITY METHODS ==========
     
@@ -345,15 +452,19 @@ Approach:
             "expertise": [e.to_dict() for e in self.expertise],
             "tools_count": len(self.tools),
             "auto_delegation": self.auto_delegation,
-            "delegation_rules": self.delegation_rules
+            "delegation_rules": dict(self.delegation_rules)
         }
     
+    def match_delegation(self, task: str) -> Optional[str]:
+        """Get the agent a task is forced to by delegation_rules, if any"""
+        if self._delegation_re is None:
+            return None
+        
+        match = self._delegation_re.match(task)
+        if match is None:
+            return None
+        return self._delegation_targets[int(match.lastgroup[1:])]
+    
     def get_tools_summary(self) -> List[Dict[str, str]]:
-        """Get summary of available tools"""
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description
-            }
-            for tool in self.tools
-        ]
+        """Get summary of available tools (a fresh copy of the cached summary)"""
+        return [dict(entry) for entry in self._tools_summary]
@@ -5,7 +5,6 @@ Handles P2P communication between agents with resilience
 
 from typing import List, Optional, Dict, Any
 import asyncio
-import uuid
 import logging
 from datetime import datetime
 from abc import ABC, abstractmethod
@@ -17,6 +16,7 @@ from .types import (
     AgentInfo
 )
 from .registry import AgentRegistry
+from ..utils.ids import new_message_id
 
 logger = logging.getLogger(__name__)
 
@@ -141,7 +141,7 @@ class AgentConnector:
         """
         
         timeout_ms = timeout_ms or self.default_timeout_ms
-        request_id = str(uuid.uuid4())
+        request_id = new_message_id()
         
         try:
             # Step 1: Get agent info
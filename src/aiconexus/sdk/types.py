@@ -7,7 +7,8 @@ from typing import List, Dict, Any, Optional, Callable
 from enum import Enum
 import json
 from datetime import datetime
-import uuid
+
+from ..utils.ids import new_message_id
 
 
 class ExpertiseLevel(str, Enum):
@@ -147,7 +148,7 @@ class AgentInfo:
 @dataclass
 class Message:
     """Message between agents"""
-    request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    request_id: str = field(default_factory=new_message_id)
     source_agent: str = ""
     target_agent: str = ""
     payload: Dict[str, Any] = field(default_factory=dict)
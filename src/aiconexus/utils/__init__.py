@@ -1,3 +1,6 @@
 """Utilities module - Helper functions and utilities"""
 
-__all__ = []
+from .ids import new_message_id
+from .timeutils import utcnow, utcnow_iso
+
+__all__ = ["new_message_id", "utcnow", "utcnow_iso"]
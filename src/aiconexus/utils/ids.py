@@ -0,0 +1,18 @@
+"""Identifier helpers shared across AIConexus"""
+
+import os
+
+
+def new_message_id() -> str:
+    """
+    Random RFC 4122 version 4 UUID as its canonical 36-char string.
+
+    Equivalent to ``str(uuid.uuid4())`` but formats straight from
+    ``os.urandom`` without building a ``UUID`` object, which is about twice
+    as fast on the per-message send path.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
@@ -0,0 +1,18 @@
+"""Time helpers shared across AIConexus"""
+
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """
+    Current time as a timezone-aware UTC datetime.
+
+    Drop-in for the deprecated (3.12+) naive ``datetime.utcnow()``; aware
+    values also serialize with an explicit UTC offset.
+    """
+    return datetime.now(timezone.utc)
+
+
+def utcnow_iso() -> str:
+    """Current UTC time as an ISO 8601 string with a ``Z`` suffix"""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -12,7 +12,7 @@ Does NOT route data plane messages - those go P2P.
 
 from typing import Dict, Optional, Any
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 import asyncio
 import logging
 import json
@@ -146,10 +146,9 @@ class GatewayServer:
             
             # Wait for REGISTER message
             register_data = await websocket.receive_text()
-            register_msg = json.loads(register_data)
             
-            # Validate REGISTER message
-            msg_obj = Message(**register_msg)
+            # Parse and validate REGISTER message in one pass
+            msg_obj = Message.model_validate_json(register_data)
             if msg_obj.type != MessageType.REGISTER:
                 error_msg = {
                     "type": "ERROR",
@@ -191,8 +190,9 @@ class GatewayServer:
         
         except WebSocketDisconnect:
             logger.debug(f"WebSocket disconnected: {agent_did}")
-        except json.JSONDecodeError as e:
-            logger.warning(f"Invalid JSON received: {e}")
+        except ValidationError as e:
+            # Covers malformed JSON as well as schema violations
+            logger.warning(f"Invalid message received: {e}")
         except Exception as e:
             logger.exception(f"Error in WebSocket handler: {e}")
         finally:
@@ -218,8 +218,8 @@ class GatewayServer:
             message_data: JSON message string
         """
         try:
-            message_dict = json.loads(message_data)
-            msg = Message(**message_dict)
+            # Parse and validate in one pass, without an intermediate dict
+            msg = Message.model_validate_json(message_data)
             
             # Update sender's activity
             await self.registry.touch(sender_did)
@@ -244,7 +244,7 @@ class GatewayServer:
                     "type": "PONG",
                     "from": "did:key:gateway",
                     "to": sender_did,
-                    "payload": msg.payload if hasattr(msg, 'payload') else {},
+                    "payload": msg.payload.model_dump(exclude_none=True),
                     "timestamp": datetime.utcnow().isoformat(),
                     "signature": "",
                     "correlation_id": msg.id,
@@ -252,10 +252,10 @@ class GatewayServer:
                 await sender_ws.send_text(json.dumps(pong_msg))
             
             else:
-                logger.debug(f"Ignoring message type: {msg.type}")
+                logger.debug("Ignoring message type: %s", msg.type)
         
-        except json.JSONDecodeError as e:
-            logger.warning(f"Invalid JSON in routed message: {e}")
+        except ValidationError as e:
+            logger.warning(f"Invalid routed message: {e}")
         except Exception as e:
             logger.warning(f"Error routing message: {e}")
     
@@ -279,7 +279,7 @@ class GatewayServer:
                 try:
                     await ws.send_text(message_data)
                     await self.registry.touch(target_did)
-                    logger.debug(f"Message routed to {target_did}")
+                    logger.debug("Message routed to %s", target_did)
                 except Exception as e:
                     logger.warning(f"Failed to send to {target_did}: {e}")
                 return
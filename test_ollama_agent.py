@@ -9,16 +9,29 @@ Tests connection to:
 
 import asyncio
 import logging
-import requests
-import json
-from datetime import datetime
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+import sys
+
+try:
+    import uvloop
+except ImportError:  # Windows or speedups extra not installed
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+# Console banners, built once at import
+_RULE = "=" * 70
+
+
+def _banner(title: str, trailer: str = "\n") -> str:
+    return f"\n{_RULE}\n{title.center(70)}\n{_RULE}\n{trailer}"
+
+
+_OLLAMA_HEADER = _banner("Testing Ollama Connection")
+_GATEWAY_HEADER = _banner("Testing Gateway Connection")
+_MAIN_HEADER = _banner("AIConexus + Ollama - Agent Gateway Test", "")
+_SUMMARY_HEADER = _banner("Summary")
+_FOOTER = f"\n{_RULE}\n\n"
+
 
 async def test_ollama(
     model: str = "phi",
@@ -26,41 +39,45 @@ async def test_ollama(
 ) -> bool:
     """Test Ollama connectivity and inference"""
     
-    print("\n" + "="*70)
-    print("Testing Ollama Connection".center(70))
-    print("="*70 + "\n")
+    sys.stdout.write(_OLLAMA_HEADER)
     
     try:
-        # Test 1: Check Ollama is running
-        logger.info("1. Checking Ollama is running...")
-        response = requests.get(f"{ollama_url}/api/tags", timeout=2)
-        models = response.json()
-        logger.info(f"   Ollama is running!")
-        logger.info(f"   Available models: {len(models.get('models', []))}")
-        
-        # Test 2: Try inference
-        logger.info(f"2. Testing inference with {model}...")
+        import aiohttp
         
-        response = requests.post(
-            f"{ollama_url}/api/generate",
-            json={
-                "model": model,
-                "prompt": "What is machine learning? Answer briefly.",
-                "stream": False
-            },
-            timeout=60
-        )
+        async with aiohttp.ClientSession() as session:
+            # Test 1: Check Ollama is running
+            logger.info("1. Checking Ollama is running...")
+            async with session.get(
+                f"{ollama_url}/api/tags",
+                timeout=aiohttp.ClientTimeout(total=2)
+            ) as response:
+                models = await response.json()
+            logger.info("   Ollama is running!")
+            logger.info("   Available models: %d", len(models.get('models', [])))
+            
+            # Test 2: Try inference (reuses the same keep-alive connection)
+            logger.info("2. Testing inference with %s...", model)
+            
+            async with session.post(
+                f"{ollama_url}/api/generate",
+                json={
+                    "model": model,
+                    "prompt": "What is machine learning? Answer briefly.",
+                    "stream": False
+                },
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                result = await response.json()
         
-        result = response.json()
         answer = result.get("response", "No response")
         
-        logger.info(f"   Model response:")
-        logger.info(f"   {answer[:150]}...")
+        logger.info("   Model response:")
+        logger.info("   %.150s...", answer)
         
         return True
         
     except Exception as e:
-        logger.error(f"Failed: {e}")
+        logger.error("Failed: %s", e)
         return False
 
 
@@ -69,14 +86,12 @@ async def test_gateway(
 ) -> bool:
     """Test Gateway connectivity"""
     
-    print("\n" + "="*70)
-    print("Testing Gateway Connection".center(70))
-    print("="*70 + "\n")
+    sys.stdout.write(_GATEWAY_HEADER)
     
     try:
         import websockets
         
-        logger.info(f"Connecting to gateway: {gateway_url}")
+        logger.info("Connecting to gateway: %s", gateway_url)
         
         async with websockets.connect(gateway_url, ping_interval=None, subprotocols=["ioap.v1"]) as ws:
             logger.info("Connected!")
@@ -89,16 +104,14 @@ async def test_gateway(
         logger.error("websockets library not installed")
         return False
     except Exception as e:
-        logger.error(f"Failed: {e}")
+        logger.error("Failed: %s", e)
         return False
 
 
 async def main():
     """Run all tests"""
     
-    print("\n" + "="*70)
-    print("AIConexus + Ollama - Agent Gateway Test".center(70))
-    print("="*70)
+    sys.stdout.write(_MAIN_HEADER)
     
     results = {
         "ollama": await test_ollama(),
@@ -106,9 +119,7 @@ async def main():
     }
     
     # Summary
-    print("\n" + "="*70)
-    print("Summary".center(70))
-    print("="*70 + "\n")
+    sys.stdout.write(_SUMMARY_HEADER)
     
     for test_name, passed in results.items():
         status = "PASS" if passed else "FAIL"
@@ -131,11 +142,17 @@ async def main():
             print("  ISSUE: Gateway not responding")
             print("  Fix: ./run_gateway.sh")
     
-    print("\n" + "="*70 + "\n")
+    sys.stdout.write(_FOOTER)
     
     return all(results.values())
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    if uvloop is not None:
+        uvloop.install()
     success = asyncio.run(main())
     exit(0 if success else 1)
@@ -12,7 +12,10 @@ This script:
 import asyncio
 import logging
 import sys
-from typing import List
+from collections import defaultdict
+from typing import Dict, List
+
+import httpx
 
 from aiconexus.client.socket import GatewayClient
 from aiconexus.protocol.security import DIDKey
@@ -26,6 +29,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Section separators, built once at import
+_SEP60 = "=" * 60
+_SECTION_RULE = "\n" + _SEP60
+
+# Per-agent inbox depth; handlers block (backpressure) once an inbox is full
+INBOX_SIZE = 256
+
+# Identities generated during server warm-up; covers every client the suite creates
+KEY_POOL_SIZE = 16
+
 
 class ServerTester:
     """Test runner for Gateway server."""
@@ -34,7 +47,17 @@ class ServerTester:
         """Initialize tester."""
         self.app = create_app(agent_timeout=60, cleanup_interval=10)
         self.clients: List[GatewayClient] = []
-        self.messages_received = []
+        self.messages_received: Dict[str, asyncio.Queue] = defaultdict(
+            lambda: asyncio.Queue(maxsize=INBOX_SIZE)
+        )
+        # One keep-alive HTTP client shared by every REST check
+        self._http = httpx.AsyncClient(
+            base_url="http://127.0.0.1:8000",
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        # Cap simultaneous handshakes so bulk spawns don't flood the accept queue
+        self._connect_slots = asyncio.Semaphore(32)
+        self._key_pool: List[DIDKey] = []
         
     async def setup_server(self):
         """Setup and run server in background."""
@@ -52,8 +75,12 @@ class ServerTester:
         # Run server in background
         self.server_task = asyncio.create_task(server.serve())
         
-        # Wait for server to start
-        await asyncio.sleep(1)
+        # Wait for server to start, pre-generating client keys meanwhile
+        _, *keys = await asyncio.gather(
+            asyncio.sleep(1),
+            *(asyncio.to_thread(DIDKey.generate) for _ in range(KEY_POOL_SIZE))
+        )
+        self._key_pool.extend(keys)
         logger.info("✅ Gateway server started on ws://127.0.0.1:8000/ws")
     
     async def create_client(self, name: str) -> GatewayClient:
@@ -65,7 +92,11 @@ class ServerTester:
         Returns:
             Connected GatewayClient
         """
-        did_key = DIDKey.generate()
+        # Key generation is CPU-bound; keep it off the event loop
+        if self._key_pool:
+            did_key = self._key_pool.pop()
+        else:
+            did_key = await asyncio.to_thread(DIDKey.generate)
         client = GatewayClient(
             gateway_url="ws://127.0.0.1:8000/ws",
             did_key=did_key,
@@ -76,7 +107,7 @@ class ServerTester:
         # Register message handler
         async def on_message(msg_dict):
             logger.info(f"[{name}] Received: {msg_dict.get('type')}")
-            self.messages_received.append((name, msg_dict))
+            await self.messages_received[name].put(msg_dict)
         
         async def on_error(error):
             logger.error(f"[{name}] Error: {error}")
@@ -85,46 +116,43 @@ class ServerTester:
         client.on_error(on_error)
         
         # Connect
-        await client.connect()
+        async with self._connect_slots:
+            await client.connect()
         logger.info(f"✅ Client '{name}' connected (DID: {did_key.did})")
         
         return client, did_key
     
     async def test_health_check(self):
         """Test health check endpoint."""
-        logger.info("\n" + "="*60)
+        logger.info(_SECTION_RULE)
         logger.info("TEST 1: Health Check Endpoint")
-        logger.info("="*60)
-        
-        import httpx
-        async with httpx.AsyncClient() as client:
-            response = await client.get("http://127.0.0.1:8000/health")
-            health = response.json()
-            logger.info(f"Health: {health}")
-            assert health["status"] == "healthy"
-            logger.info("✅ Health check passed")
+        logger.info(_SEP60)
+        
+        response = await self._http.get("/health")
+        health = response.json()
+        logger.info(f"Health: {health}")
+        assert health["status"] == "healthy"
+        logger.info("✅ Health check passed")
     
     async def test_list_agents(self):
         """Test listing connected agents."""
-        logger.info("\n" + "="*60)
+        logger.info(_SECTION_RULE)
         logger.info("TEST 2: List Agents Endpoint")
-        logger.info("="*60)
-        
-        import httpx
-        async with httpx.AsyncClient() as client:
-            response = await client.get("http://127.0.0.1:8000/agents")
-            agents_data = response.json()
-            logger.info(f"Connected agents: {agents_data['count']}")
-            for agent in agents_data["agents"]:
-                logger.info(f"  - {agent['did']}")
-            # Note: agents_data['count'] may be 0 if no clients connected yet
-            logger.info("✅ Agent listing passed")
+        logger.info(_SEP60)
+        
+        response = await self._http.get("/agents")
+        agents_data = response.json()
+        logger.info(f"Connected agents: {agents_data['count']}")
+        for agent in agents_data["agents"]:
+            logger.info(f"  - {agent['did']}")
+        # Note: agents_data['count'] may be 0 if no clients connected yet
+        logger.info("✅ Agent listing passed")
     
     async def test_connection(self):
         """Test client connection."""
-        logger.info("\n" + "="*60)
+        logger.info(_SECTION_RULE)
         logger.info("TEST 3: Client Connection")
-        logger.info("="*60)
+        logger.info(_SEP60)
         
         client, did_key = await self.create_client("Agent1")
         self.clients.append(client)
@@ -134,9 +162,9 @@ class ServerTester:
     
     async def test_message_routing(self):
         """Test message routing between clients."""
-        logger.info("\n" + "="*60)
+        logger.info(_SECTION_RULE)
         logger.info("TEST 4: Message Routing")
-        logger.info("="*60)
+        logger.info(_SEP60)
         
         # Create two clients
         client1, did1 = await self.create_client("Agent1")
@@ -145,7 +173,7 @@ class ServerTester:
         self.clients.extend([client1, client2])
         
         # Clear previous messages
-        self.messages_received = []
+        self.messages_received.clear()
         
         # Send OFFER from client1 to client2
         logger.info(f"\nSending OFFER from {did1.did[:20]}... to {did2.did[:20]}...")
@@ -164,15 +192,16 @@ class ServerTester:
         
         await client1.send(offer_message)
         
-        # Wait for message to be routed
-        await asyncio.sleep(0.5)
-        
-        # Check if message was received by client2
-        received = [msg for name, msg in self.messages_received if name == "Agent2"]
-        logger.info(f"Messages received by Agent2: {len(received)}")
-        
-        if received:
-            msg = received[0]
+        # Wait (only as long as needed) for the message to reach client2
+        try:
+            msg = await asyncio.wait_for(
+                self.messages_received["Agent2"].get(),
+                timeout=1.0
+            )
+        except asyncio.TimeoutError:
+            msg = None
+        
+        if msg is not None:
             logger.info(f"  Type: {msg.get('type')}")
             logger.info(f"  From: {msg.get('from')[:20]}...")
             logger.info(f"  To: {msg.get('to')[:20]}...")
@@ -182,9 +211,9 @@ class ServerTester:
     
     async def test_concurrent_agents(self):
         """Test with multiple concurrent agents."""
-        logger.info("\n" + "="*60)
+        logger.info(_SECTION_RULE)
         logger.info("TEST 5: Concurrent Agents")
-        logger.info("="*60)
+        logger.info(_SEP60)
         
         # Create 5 agents
         agent_count = 5
@@ -209,9 +238,9 @@ class ServerTester:
     
     async def test_disconnection(self):
         """Test client disconnection and cleanup."""
-        logger.info("\n" + "="*60)
+        logger.info(_SECTION_RULE)
         logger.info("TEST 6: Disconnection and Cleanup")
-        logger.info("="*60)
+        logger.info(_SEP60)
         
         if self.clients:
             client_to_close = self.clients[0]
@@ -224,16 +253,21 @@ class ServerTester:
     
     async def cleanup(self):
         """Clean up resources."""
-        logger.info("\n" + "="*60)
+        logger.info(_SECTION_RULE)
         logger.info("CLEANUP")
-        logger.info("="*60)
+        logger.info(_SEP60)
         
         logger.info("Closing all clients...")
-        for client in self.clients:
-            try:
-                await client.disconnect()
-            except Exception as e:
-                logger.debug(f"Error closing client: {e}")
+        # Overlap the CLOSE handshakes instead of paying one RTT per client
+        results = await asyncio.gather(
+            *(client.disconnect() for client in self.clients),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug(f"Error closing client: {result}")
+        
+        await self._http.aclose()
         
         logger.info("Stopping server...")
         if hasattr(self, 'server_task'):
@@ -258,9 +292,9 @@ class ServerTester:
             await self.test_disconnection()
             
             # Summary
-            logger.info("\n" + "="*60)
+            logger.info(_SECTION_RULE)
             logger.info("🎉 ALL TESTS PASSED!")
-            logger.info("="*60)
+            logger.info(_SEP60)
             
             return True
         
@@ -12,6 +12,7 @@ Tests:
 import pytest
 import asyncio
 import json
+import threading
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch, call
 from datetime import datetime
@@ -77,6 +78,20 @@ class TestGatewayClientInit:
         )
         assert client.reconnect_interval == 2.0
         assert client.max_reconnect_attempts == 10
+    
+    def test_backoff_delay_is_jittered_and_capped(self, did_key: DIDKey):
+        """Test reconnect delays stay within the capped exponential window."""
+        client = GatewayClient(
+            gateway_url="ws://localhost:8000/ws",
+            did_key=did_key,
+            reconnect_interval=1.0,
+            max_backoff=5.0,
+        )
+        with patch("aiconexus.client.socket.random.uniform", side_effect=lambda a, b: b):
+            assert [client._backoff_delay(n) for n in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+        
+        for attempt in range(1, 10):
+            assert 0 <= client._backoff_delay(attempt) <= 5.0
 
 
 class TestHandlerRegistration:
@@ -142,6 +157,22 @@ class TestDispatchMessage:
         
         handler.assert_called_once_with(message)
     
+    async def test_dispatch_message_blocking_handler_runs_off_loop(self, client: GatewayClient):
+        """Test that handlers registered as blocking run in a worker thread."""
+        seen = []
+        
+        def heavy_handler(message):
+            seen.append((message, threading.get_ident()))
+        
+        client.on_message(heavy_handler, blocking=True)
+        
+        message = {"type": "TEST"}
+        await client._dispatch_message(message)
+        
+        assert len(seen) == 1
+        assert seen[0][0] == message
+        assert seen[0][1] != threading.get_ident()
+    
     async def test_dispatch_message_handler_exception(self, client: GatewayClient):
         """Test that handler exceptions are caught and dispatched as errors."""
         message_handler = AsyncMock(side_effect=RuntimeError("Test error"))
@@ -155,6 +186,47 @@ class TestDispatchMessage:
         
         # Error handler should be called
         assert error_handler.called
+    
+    async def test_schedule_dispatch_does_not_block(self, client: GatewayClient):
+        """Test that a slow handler does not block scheduling the next message."""
+        release = asyncio.Event()
+        received = []
+        
+        async def slow_handler(message):
+            await release.wait()
+            received.append(message)
+        
+        client.on_message(slow_handler)
+        
+        await client._schedule_dispatch({"type": "PING"})
+        await client._schedule_dispatch({"type": "PONG"})
+        assert received == []
+        assert len(client._dispatch_tasks) == 2
+        
+        release.set()
+        await asyncio.gather(*client._dispatch_tasks)
+        assert len(received) == 2
+        assert not client._dispatch_tasks
+    
+    async def test_schedule_dispatch_keeps_sender_order(self, client: GatewayClient):
+        """Test that frames from one sender are handled in arrival order."""
+        order = []
+        
+        async def handler(message):
+            # Earlier frames take longer, so unordered dispatch would reverse them
+            await asyncio.sleep(message["delay"])
+            order.append(message["type"])
+        
+        client.on_message(handler)
+        
+        await client._schedule_dispatch({"from": "did:key:a", "type": "OFFER", "delay": 0.03})
+        await client._schedule_dispatch({"from": "did:key:a", "type": "ICE_CANDIDATE", "delay": 0})
+        await client._schedule_dispatch({"from": "did:key:b", "type": "PING", "delay": 0})
+        await asyncio.gather(*client._dispatch_tasks)
+        
+        # The other sender isn't held back; sender a's frames stay in order
+        assert order == ["PING", "OFFER", "ICE_CANDIDATE"]
+        assert not client._sender_tails
 
 
 @pytest.mark.asyncio
@@ -185,6 +257,71 @@ class TestDispatchError:
         handler2.assert_called_once_with(error)
 
 
+class _FrameSource:
+    """Async-iterable stand-in for a connected websocket."""
+    
+    def __init__(self, *frames: str):
+        self._frames = list(frames)
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self) -> str:
+        if not self._frames:
+            raise StopAsyncIteration
+        return self._frames.pop(0)
+
+
+@pytest.mark.asyncio
+class TestReceiveMessages:
+    """Test the inbound receive loop."""
+    
+    async def test_receive_dispatches_without_full_validation(self, client: GatewayClient):
+        """Test that frames reach handlers without schema validation by default."""
+        handler = AsyncMock()
+        client.on_message(handler)
+        client._websocket = _FrameSource(json.dumps({"type": "PONG"}))
+        
+        await client._receive_messages()
+        await asyncio.gather(*client._dispatch_tasks)
+        
+        handler.assert_called_once_with({"type": "PONG"})
+    
+    async def test_receive_strict_validation_rejects_partial_message(self, did_key: DIDKey):
+        """Test that strict_validation reports malformed frames as errors."""
+        client = GatewayClient(
+            gateway_url="ws://localhost:8000/ws",
+            did_key=did_key,
+            strict_validation=True,
+        )
+        handler = AsyncMock()
+        error_handler = AsyncMock()
+        client.on_message(handler)
+        client.on_error(error_handler)
+        client._websocket = _FrameSource(json.dumps({"type": "PONG"}))
+        
+        await client._receive_messages()
+        
+        handler.assert_not_called()
+        assert isinstance(error_handler.call_args[0][0], ProtocolError)
+    
+    async def test_receive_rejects_non_object_frame(self, client: GatewayClient):
+        """Test that a JSON frame that is not an object is reported, not dispatched."""
+        handler = AsyncMock()
+        error_handler = AsyncMock()
+        client.on_message(handler)
+        client.on_error(error_handler)
+        client._websocket = _FrameSource("[1, 2, 3]", json.dumps({"type": "PONG"}))
+        
+        await client._receive_messages()
+        await asyncio.gather(*client._dispatch_tasks)
+        
+        error = error_handler.call_args[0][0]
+        assert isinstance(error, ProtocolError)
+        assert "expected a JSON object" in str(error)
+        handler.assert_called_once_with({"type": "PONG"})
+
+
 @pytest.mark.asyncio
 class TestRegister:
     """Test agent registration."""
@@ -208,6 +345,26 @@ class TestRegister:
         assert message_dict["from"] == client.agent_did
         assert message_dict["payload"]["public_key"] == public_key
     
+    async def test_register_signature_covers_sent_frame(self, client: GatewayClient):
+        """Test that the REGISTER signature verifies against the frame as sent."""
+        client._websocket = AsyncMock()
+        client.state = ConnectionState.CONNECTED
+        
+        await client.register(client.did_key.public_key_base58)
+        
+        sent = json.loads(client._websocket.send.call_args[0][0])
+        signature = sent.pop("signature")
+        assert MessageSigner.verify_message(sent, signature, client.agent_did)
+    
+    async def test_register_message_matches_schema(self, client: GatewayClient):
+        """Test that the hand-built REGISTER dict is a valid Message with the same layout."""
+        sent = client._build_register_message("test_public_key")
+        
+        message = Message.model_validate(sent)
+        assert message.type == MessageType.REGISTER
+        assert message.payload == RegisterPayload(public_key="test_public_key")
+        assert list(sent) == list(message.model_dump(mode="json", by_alias=True))
+    
     async def test_register_when_disconnected(self, client: GatewayClient):
         """Test registration when disconnected raises error."""
         client.state = ConnectionState.DISCONNECTED
@@ -249,6 +406,52 @@ class TestSend:
         # Should have called send on WebSocket
         assert client._websocket.send.called
     
+    async def test_send_serializes_text_frame(self, client: GatewayClient):
+        """Test that messages are sent as JSON text with UTC timestamps."""
+        client._websocket = AsyncMock()
+        client.state = ConnectionState.CONNECTED
+        
+        message = {
+            "id": str(uuid.uuid4()),
+            "type": "PING",
+            "from": client.agent_did,
+            "to": client.agent_did,
+            "payload": {},
+            "timestamp": datetime(2026, 1, 12, 10, 0, 0).isoformat(),
+            "signature": "test_sig",
+        }
+        
+        await client.send(message)
+        
+        sent_data = client._websocket.send.call_args[0][0]
+        assert isinstance(sent_data, str)
+        sent = json.loads(sent_data)
+        assert sent["type"] == "PING"
+        assert sent["timestamp"] == "2026-01-12T10:00:00Z"
+    
+    async def test_send_message_instance_skips_validation(self, client: GatewayClient):
+        """Test that a Message instance is serialized without re-validation."""
+        client._websocket = AsyncMock()
+        client.state = ConnectionState.CONNECTED
+        
+        message = Message(
+            id=str(uuid.uuid4()),
+            type=MessageType.PING,
+            **{"from": client.agent_did, "to": client.agent_did},
+            payload={},
+            timestamp=datetime(2026, 1, 12, 10, 0, 0),
+            signature="test_sig",
+        )
+        
+        with patch.object(Message, "model_validate") as model_validate:
+            await client.send(message)
+        
+        model_validate.assert_not_called()
+        sent = json.loads(client._websocket.send.call_args[0][0])
+        assert sent["id"] == message.id
+        assert sent["from"] == client.agent_did
+        assert sent["timestamp"] == "2026-01-12T10:00:00Z"
+    
     async def test_send_when_disconnected(self, client: GatewayClient):
         """Test sending when disconnected raises error."""
         client.state = ConnectionState.DISCONNECTED
@@ -295,6 +498,26 @@ class TestSend:
         
         # Error handler should have been called
         assert error_handler.called
+    
+    async def test_ping_frame_is_valid_message(self, client: GatewayClient):
+        """Test that the templated PING frame is a valid Message."""
+        client._websocket = AsyncMock()
+        client.state = ConnectionState.CONNECTED
+        
+        assert await client.ping() == 1
+        assert await client.ping() == 2
+        
+        sent = client._websocket.send.call_args[0][0]
+        message = Message.model_validate_json(sent)
+        assert message.type == MessageType.PING
+        assert message.from_did == client.agent_did
+        assert json.loads(sent)["payload"] == {"sequence": 2}
+        assert uuid.UUID(message.id).version == 4
+    
+    async def test_ping_when_disconnected(self, client: GatewayClient):
+        """Test that ping requires a connection."""
+        with pytest.raises(ConnectionError):
+            await client.ping()
 
 
 @pytest.mark.asyncio
@@ -303,23 +526,21 @@ class TestContextManager:
     
     async def test_context_manager_connect_disconnect(self, client: GatewayClient):
         """Test using client as context manager."""
-        # Mock connect and disconnect
-        client.connect = AsyncMock()
-        client.disconnect = AsyncMock()
-        
-        async with client:
-            pass
-        
-        client.connect.assert_called_once()
-        client.disconnect.assert_called_once()
+        # Mock connect and disconnect (patched on the class: GatewayClient uses __slots__)
+        with patch.object(GatewayClient, "connect", new_callable=AsyncMock) as connect, \
+                patch.object(GatewayClient, "disconnect", new_callable=AsyncMock) as disconnect:
+            async with client:
+                pass
+        
+        connect.assert_called_once()
+        disconnect.assert_called_once()
     
     async def test_context_manager_returns_self(self, client: GatewayClient):
         """Test that context manager returns self."""
-        client.connect = AsyncMock()
-        client.disconnect = AsyncMock()
-        
-        async with client as c:
-            assert c is client
+        with patch.object(GatewayClient, "connect", new_callable=AsyncMock), \
+                patch.object(GatewayClient, "disconnect", new_callable=AsyncMock):
+            async with client as c:
+                assert c is client
 
 
 @pytest.mark.asyncio
@@ -368,6 +589,31 @@ class TestDisconnect:
         
         # Verify cancel was called
         task_mock.cancel.assert_called_once()
+    
+    async def test_disconnect_cancels_handler_tasks(self, client: GatewayClient):
+        """Test that disconnect cancels and awaits in-flight handlers."""
+        started = asyncio.Event()
+        cancelled = []
+        
+        async def slow_handler(message):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(message)
+                raise
+        
+        client.on_message(slow_handler)
+        client._websocket = AsyncMock()
+        client.state = ConnectionState.CONNECTED
+        
+        await client._schedule_dispatch({"type": "PING"})
+        await started.wait()
+        await client.disconnect()
+        
+        assert cancelled == [{"type": "PING"}]
+        assert not client._dispatch_tasks
+        assert client.state == ConnectionState.DISCONNECTED
 
 
 @pytest.mark.asyncio
@@ -378,8 +624,8 @@ class TestSetState:
         """Test that set_state updates the state."""
         assert client.state == ConnectionState.DISCONNECTED
         
-        await client._set_state(ConnectionState.CONNECTING)
+        client._set_state(ConnectionState.CONNECTING)
         assert client.state == ConnectionState.CONNECTING
         
-        await client._set_state(ConnectionState.CONNECTED)
+        client._set_state(ConnectionState.CONNECTED)
         assert client.state == ConnectionState.CONNECTED
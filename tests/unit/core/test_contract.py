@@ -0,0 +1,20 @@
+"""Tests for Contract defaults."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from aiconexus.core.contract import Contract
+
+
+def test_default_created_at_compares_with_expires_at():
+    """Test that a default created_at is naive UTC like expires_at."""
+    contract = Contract(
+        requester_id=uuid4(),
+        provider_id=uuid4(),
+        capability_id="greet",
+        terms={},
+        expires_at=datetime.utcnow() + timedelta(hours=1),
+    )
+    
+    assert contract.created_at.tzinfo is None
+    assert contract.created_at < contract.expires_at
@@ -1,5 +1,6 @@
 """Tests for monitoring and metrics modules."""
 
+import json
 import pytest
 import asyncio
 
@@ -13,6 +14,7 @@ from aiconexus.monitoring.metrics import (
     get_collector,
     reset_collector,
 )
+from aiconexus.monitoring import health
 from aiconexus.monitoring.health import (
     HealthChecker,
     HealthStatus,
@@ -59,7 +61,7 @@ class TestMetricsCollector:
         
         assert len(metric.values) == 1
         values = list(metric.values.values())
-        assert values[0].value == 42.5
+        assert values[0] == 42.5
     
     def test_record_metric_with_labels(self):
         """Test recording metrics with labels."""
@@ -84,6 +86,18 @@ class TestMetricsCollector:
         assert "# TYPE test gauge" in export
         assert "test 42.0" in export
     
+    def test_prometheus_export_with_labels(self):
+        """Test that labels are rendered sorted and reflect the latest value."""
+        collector = MetricsCollector()
+        collector.register_metric("test", "Test metric", MetricType.GAUGE)
+        collector.record("test", 1.0, labels={"peer": "p1", "kind": "data"})
+        collector.record("test", 2.0, labels={"kind": "data", "peer": "p1"})
+        
+        export = collector.export_prometheus()
+        
+        assert 'test{kind="data",peer="p1"} 2.0' in export
+        assert export.count("test{") == 1
+    
     def test_uptime_seconds(self):
         """Test uptime calculation."""
         collector = MetricsCollector()
@@ -146,6 +160,20 @@ class TestMessageMetrics:
         assert sent_metric is not None
         assert bytes_metric is not None
     
+    def test_message_sent_accumulates(self):
+        """Test that message counters accumulate across calls."""
+        collector = MetricsCollector()
+        msg_metrics = MessageMetrics(collector)
+        
+        msg_metrics.message_sent(100)
+        msg_metrics.message_sent(50)
+        
+        sent_metric = collector.get_metric("webrtc_messages_sent_total")
+        bytes_metric = collector.get_metric("webrtc_message_bytes_sent_total")
+        
+        assert list(sent_metric.values.values()) == [2.0]
+        assert list(bytes_metric.values.values()) == [150.0]
+    
     def test_message_received(self):
         """Test recording received message."""
         collector = MetricsCollector()
@@ -174,6 +202,22 @@ class TestErrorMetrics:
         
         metric = collector.get_metric("webrtc_errors_total")
         assert len(metric.values) >= 2  # At least 2 different error types
+        
+        by_type = {dict(key)["error_type"]: value for key, value in metric.values.items()}
+        assert by_type == {"timeout": 2.0, "network": 1.0}
+    
+    def test_error_rate_sliding_window(self):
+        """Test that the error rate only counts errors from the last minute."""
+        collector = MetricsCollector()
+        err_metrics = ErrorMetrics(collector)
+        
+        err_metrics.error_occurred("timeout")
+        err_metrics.error_occurred("timeout")
+        err_metrics._error_times[0] -= 120  # first error is two minutes old
+        err_metrics.update_error_rate()
+        
+        metric = collector.get_metric("webrtc_error_rate")
+        assert list(metric.values.values()) == [1 / 60.0]
 
 
 class TestRetryMetrics:
@@ -294,6 +338,44 @@ class TestHealthChecker:
         # Should timeout and be marked unhealthy
         assert result.checks_failed == 1
     
+    @pytest.mark.asyncio
+    async def test_health_check_per_check_timeout(self):
+        """Test that each check uses its own registered timeout."""
+        checker = HealthChecker()
+        
+        async def mock_check_slow():
+            await asyncio.sleep(0.2)
+            return HealthStatus.HEALTHY, "OK"
+        
+        checker.register_check("tight", mock_check_slow, timeout=0.05)
+        checker.register_check("loose", mock_check_slow, timeout=1.0)
+        result = await checker.check_health()
+        
+        assert result.components["tight"].message == "Check timed out"
+        assert result.components["loose"].status == HealthStatus.HEALTHY
+    
+    @pytest.mark.asyncio
+    async def test_health_check_concurrency_bounded(self):
+        """Test that no more than max_concurrent_checks probes run at once."""
+        checker = HealthChecker(max_concurrent_checks=2)
+        running = 0
+        peak = 0
+        
+        async def mock_check():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return HealthStatus.HEALTHY, "OK"
+        
+        for i in range(6):
+            checker.register_check(f"probe{i}", mock_check)
+        result = await checker.check_health()
+        
+        assert result.checks_passed == 6
+        assert peak == 2
+    
     @pytest.mark.asyncio
     async def test_component_health_tracking(self):
         """Test component health tracking."""
@@ -305,11 +387,34 @@ class TestHealthChecker:
         checker.register_check("component", mock_check)
         
         result1 = await checker.check_health()
-        result2 = await checker.check_health()
+        result2 = await checker.check_health(use_cache=False)
         
         component = result2.components["component"]
         assert component.check_count == 2
     
+    @pytest.mark.asyncio
+    async def test_health_check_cached_within_ttl(self):
+        """Test that repeated checks within the TTL reuse the last result."""
+        checker = HealthChecker()
+        calls = 0
+        
+        async def mock_check():
+            nonlocal calls
+            calls += 1
+            return HealthStatus.HEALTHY, "OK"
+        
+        checker.register_check("component", mock_check)
+        
+        result1 = await checker.check_health()
+        result2 = await checker.check_health()
+        
+        assert result2 is result1
+        assert calls == 1
+        
+        checker.CACHE_TTL = 0.0
+        await checker.check_health()
+        assert calls == 2
+    
     @pytest.mark.asyncio
     async def test_health_result_to_dict(self):
         """Test converting health result to dictionary."""
@@ -327,6 +432,9 @@ class TestHealthChecker:
         assert "timestamp" in result_dict
         assert "components" in result_dict
         assert "checks_passed" in result_dict
+        assert result_dict["status"] == "healthy"
+        assert json.loads(json.dumps(result_dict))["components"]["test"]["status"] == "healthy"
+        assert json.loads(result.to_json()) == json.loads(json.dumps(result_dict))
 
 
 @pytest.mark.asyncio
@@ -338,6 +446,27 @@ async def test_check_memory():
     assert isinstance(message, str)
 
 
+@pytest.mark.asyncio
+async def test_check_memory_reuses_recent_sample(monkeypatch):
+    """Test that psutil is sampled at most once per PSUTIL_SAMPLE_TTL."""
+    pytest.importorskip("psutil")
+    reset_checker()
+    calls = 0
+    real_virtual_memory = health.psutil.virtual_memory
+    
+    def counting_virtual_memory():
+        nonlocal calls
+        calls += 1
+        return real_virtual_memory()
+    
+    monkeypatch.setattr(health.psutil, "virtual_memory", counting_virtual_memory)
+    
+    await check_memory()
+    await check_memory()
+    
+    assert calls == 1
+
+
 @pytest.mark.asyncio
 async def test_check_disk():
     """Test disk health check."""
@@ -4,10 +4,12 @@ Unit tests for protocol models.
 
 import pytest
 from datetime import datetime
+from pydantic import ValidationError
 from aiconexus.protocol.models import (
     Message,
     MessageType,
     ErrorCode,
+    PongPayload,
     RegisterPayload,
     IntentPayload,
     ExecRequestPayload,
@@ -136,6 +138,42 @@ class TestMessage:
         assert "signature" not in sig_dict
         assert sig_dict["id"] == "msg_789"
     
+    def test_message_dict_for_signature_isolated_from_callers(self):
+        """Test that editing the returned dict doesn't affect later calls."""
+        msg = Message(
+            id="msg_789",
+            timestamp=datetime.utcnow(),
+            from_did="did:key:z6MkA",
+            to_did="did:key:z6MkB",
+            type=MessageType.PING,
+            payload={},
+            signature="sig_789"
+        )
+        sig_dict = msg.dict_for_signature
+        sig_dict["id"] = "tampered"
+        sig_dict["signature"] = "sig_789"
+        
+        assert msg.dict_for_signature["id"] == "msg_789"
+        assert "signature" not in msg.dict_for_signature
+    
+    def test_message_dict_for_signature_tracks_assignment(self):
+        """Test that reassigning a signed field refreshes dict_for_signature."""
+        msg = Message(
+            id="msg_789",
+            timestamp=datetime.utcnow(),
+            from_did="did:key:z6MkA",
+            to_did="did:key:z6MkB",
+            type=MessageType.PING,
+            payload={},
+            signature="sig_789"
+        )
+        assert msg.dict_for_signature["to"] == "did:key:z6MkB"
+        
+        msg.to_did = "did:key:z6MkC"
+        msg.signature = "sig_new"
+        
+        assert msg.dict_for_signature["to"] == "did:key:z6MkC"
+    
     def test_message_version_default(self):
         """Test default protocol version."""
         msg = Message(
@@ -162,6 +200,37 @@ class TestMessage:
         )
         after = datetime.utcnow()
         assert before <= msg.timestamp <= after
+    
+    def test_message_payload_parsed_by_type(self):
+        """Test that a raw payload is validated against its type's model."""
+        msg = Message.model_validate({
+            "id": "msg_pong",
+            "from": "did:key:z6MkA",
+            "to": "did:key:z6MkB",
+            "type": "PONG",
+            "payload": {},
+            "signature": "sig",
+        })
+        assert type(msg.payload) is PongPayload
+        
+        msg = Message.model_validate_json(
+            '{"id": "msg_exec", "from": "did:key:z6MkA", "to": "did:key:z6MkB",'
+            ' "type": "EXEC_RESPONSE", "payload": {"result": {"ok": true}},'
+            ' "signature": "sig"}'
+        )
+        assert type(msg.payload) is ExecResponsePayload
+    
+    def test_message_payload_must_match_type(self):
+        """Test that a payload for another message type is rejected."""
+        with pytest.raises(ValidationError):
+            Message.model_validate({
+                "id": "msg_bad",
+                "from": "did:key:z6MkA",
+                "to": "did:key:z6MkB",
+                "type": "REGISTER",
+                "payload": {"sdp": "v=0"},
+                "signature": "sig",
+            })
 
 
 class TestErrorCode:
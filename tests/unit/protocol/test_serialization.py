@@ -3,6 +3,7 @@ Unit tests for protocol serialization.
 """
 
 import json
+import uuid
 import pytest
 from datetime import datetime
 from aiconexus.protocol.serialization import (
@@ -43,6 +44,38 @@ class TestCanonicalJSON:
         assert "m" in result
         assert "z" in result
         assert result.index("a") < result.index("m") < result.index("z")
+    
+    @pytest.mark.parametrize("data", [
+        {"id": "msg_1", "version": "1.0", "payload": {"n": 3, "ok": True, "x": None}},
+        {"floats": [1e16, 6.2e-05, -0.5, 1.0]},
+        {"text": "caf\u00e9 \u4e2d \x7f"},
+        {"big": 2 ** 70},
+        {"a": float("nan")},
+        {"a": [float("inf"), float("-inf")], "b": None},
+    ])
+    def test_canonical_encode_matches_json(self, data):
+        """Test that canonical bytes match json.dumps exactly (signature compatibility)."""
+        expected = json.dumps(data, separators=(",", ":"), sort_keys=True)
+        
+        assert CanonicalJSON.encode(data) == expected.encode("ascii")
+        assert CanonicalJSON.dumps(data) == expected
+    
+    def test_canonical_nan_differs_from_null(self):
+        """Test that NaN and None don't produce the same signing input."""
+        assert CanonicalJSON.encode({"a": float("nan")}) != CanonicalJSON.encode({"a": None})
+    
+    @pytest.mark.parametrize("value", [
+        datetime(2024, 1, 1),
+        uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    ])
+    def test_canonical_rejects_non_json_types(self, value):
+        """Test that types json.dumps rejects raise the same TypeError."""
+        with pytest.raises(TypeError) as expected:
+            json.dumps({"a": value}, separators=(",", ":"), sort_keys=True)
+        with pytest.raises(TypeError) as actual:
+            CanonicalJSON.encode({"a": value})
+        
+        assert str(actual.value) == str(expected.value)
 
 
 class TestMessageSerializer:
@@ -0,0 +1,127 @@
+"""Tests for SDKAgent delegation rules and summaries."""
+
+import pytest
+
+from aiconexus.sdk.agent import SDKAgent
+from aiconexus.sdk.types import ExpertiseArea
+
+
+RULES = {
+    "legal*": "legal-expert",
+    "*optimization*": "optimizer",
+    "*analysis*": "analyst",
+}
+
+
+def make_agent(delegation_rules=None) -> SDKAgent:
+    """Create an agent with a stub LLM."""
+    return SDKAgent(
+        name="planner",
+        expertise=[ExpertiseArea("planning", 0.9)],
+        llm=object(),
+        delegation_rules=delegation_rules,
+    )
+
+
+class TestDelegationRules:
+    """Test glob delegation rule matching."""
+    
+    def test_match_returns_target(self):
+        """Test that a matching task returns the rule's agent."""
+        agent = make_agent(RULES)
+        
+        assert agent.match_delegation("legal review of the NDA") == "legal-expert"
+        assert agent.match_delegation("run a cost analysis") == "analyst"
+    
+    def test_first_matching_rule_wins(self):
+        """Test that rule order decides between overlapping patterns."""
+        agent = make_agent(RULES)
+        
+        assert agent.match_delegation("optimization analysis") == "optimizer"
+    
+    def test_no_match_returns_none(self):
+        """Test that unmatched tasks and empty rules return None."""
+        assert make_agent(RULES).match_delegation("write a poem") is None
+        assert make_agent().match_delegation("legal review") is None
+    
+    def test_match_is_case_sensitive(self):
+        """Test that matching follows fnmatchcase semantics."""
+        agent = make_agent(RULES)
+        
+        assert agent.match_delegation("Legal review") is None
+    
+    def test_reassigning_rules_recompiles(self):
+        """Test that replacing delegation_rules takes effect."""
+        agent = make_agent(RULES)
+        agent.delegation_rules = {"poem*": "poet"}
+        
+        assert agent.match_delegation("poem about the sea") == "poet"
+        assert agent.match_delegation("legal review") is None
+    
+    def test_rules_are_read_only(self):
+        """Test that in-place edits fail instead of being silently ignored."""
+        agent = make_agent(RULES)
+        
+        with pytest.raises(TypeError):
+            agent.delegation_rules["poem*"] = "poet"
+    
+    @pytest.mark.asyncio
+    async def test_execute_injects_delegate_to(self):
+        """Test that execute() passes the matched agent in the context."""
+        agent = make_agent(RULES)
+        seen = {}
+        
+        class Executor:
+            async def run(self, task, context, source_agent_id):
+                seen.update(context)
+                return {"answer": "done", "success": True}
+        
+        async def create_react_executor(**kwargs):
+            return Executor()
+        
+        agent.sdk.create_react_executor = create_react_executor
+        result = await agent.execute("legal review", context={"priority": "high"})
+        
+        assert result.success
+        assert seen == {"priority": "high", "delegate_to": "legal-expert"}
+    
+    @pytest.mark.asyncio
+    async def test_execute_without_match_leaves_context(self):
+        """Test that unmatched tasks get no delegate_to hint."""
+        agent = make_agent(RULES)
+        seen = {}
+        
+        class Executor:
+            async def run(self, task, context, source_agent_id):
+                seen.update(context)
+                return {"answer": "done", "success": True}
+        
+        async def create_react_executor(**kwargs):
+            return Executor()
+        
+        agent.sdk.create_react_executor = create_react_executor
+        await agent.execute("write a poem")
+        
+        assert "delegate_to" not in seen
+
+
+class TestToolsSummary:
+    """Test the cached tools summary."""
+    
+    def test_summary_lists_tools(self):
+        """Test that the summary names every tool."""
+        agent = make_agent()
+        
+        names = [entry["name"] for entry in agent.get_tools_summary()]
+        assert names == [tool.name for tool in agent.tools]
+    
+    def test_summary_is_isolated_from_callers(self):
+        """Test that editing a returned summary doesn't affect later calls."""
+        agent = make_agent()
+        summary = agent.get_tools_summary()
+        expected = agent.get_tools_summary()
+        
+        summary.append({"name": "extra", "description": ""})
+        summary[0]["name"] = "renamed"
+        
+        assert agent.get_tools_summary() == expected